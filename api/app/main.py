@@ -9,6 +9,7 @@ import os
 
 # Importar routers
 from app.routers import klines, indicators, exchanges, news, auth
+from app.utils.market_data import aclose_all
 
 app = FastAPI(
     title="TradingRoad API",
@@ -32,6 +33,11 @@ app.include_router(exchanges.router, prefix="/api/v1", tags=["exchanges"])
 app.include_router(news.router, prefix="/api/v1", tags=["news"])
 app.include_router(auth.router, prefix="/api/v1/auth", tags=["auth"])
 
+@app.on_event("shutdown")
+async def close_market_data_clients():
+    """Cierra las sesiones HTTP de los clientes CCXT asíncronos al apagar la API"""
+    await aclose_all()
+
 @app.get("/", tags=["root"])
 async def root():
     """Endpoint raíz que muestra información básica de la API"""
@@ -6,7 +6,7 @@ from fastapi import APIRouter, HTTPException, Query, Path
 from typing import List, Dict, Any
 
 # Importar utilidades
-from app.utils.market_data import MarketDataClient
+from app.utils.market_data import get_market_data_client
 
 router = APIRouter()
 
@@ -16,7 +16,7 @@ async def get_exchanges():
     Obtiene la lista de exchanges disponibles a través de CCXT
     """
     try:
-        client = MarketDataClient()
+        client = get_market_data_client()
         exchanges = client.get_available_exchanges()
         
         return {
@@ -35,7 +35,7 @@ async def get_exchange_pairs(
     Obtiene los pares de trading disponibles para un exchange específico
     """
     try:
-        client = MarketDataClient(exchange_id=exchange_id)
+        client = get_market_data_client(exchange_id)
         pairs = client.get_available_pairs()
         
         # Organizar por tipo de activo
@@ -64,7 +64,7 @@ async def get_exchange_info(
     Obtiene información general sobre un exchange específico
     """
     try:
-        client = MarketDataClient(exchange_id=exchange_id)
+        client = get_market_data_client(exchange_id)
         
         # Verificamos que el exchange exista
         if not client.ccxt_client:
@@ -95,7 +95,7 @@ async def get_markets(limit: int = Query(10, description="Número máximo de mer
     """
     try:
         # Usamos Binance como exchange por defecto para este endpoint
-        client = MarketDataClient(exchange_id="binance")
+        client = get_market_data_client("binance")
         
         # Símbolos populares para mostrar
         popular_symbols = [
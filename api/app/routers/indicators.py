@@ -8,7 +8,7 @@ import pandas as pd
 import numpy as np
 
 # Importar utilidades
-from app.utils.market_data import MarketDataClient
+from app.utils.market_data import get_market_data_client
 from app.utils.technical_analysis import get_technical_indicators, calculate_volatility
 
 router = APIRouter()
@@ -24,7 +24,7 @@ async def get_all_indicators(
     Obtiene un conjunto completo de indicadores técnicos para un activo
     """
     try:
-        client = MarketDataClient(exchange_id=exchange)
+        client = get_market_data_client(exchange)
         df = client.get_ohlcv_data(symbol, interval, limit)
         
         if df.empty or len(df) < 50:  # Necesitamos al menos 50 velas para cálculos confiables
@@ -87,7 +87,7 @@ async def get_sma_data(
     Obtiene datos de Medias Móviles Simples (SMA) para los períodos especificados
     """
     try:
-        client = MarketDataClient(exchange_id=exchange)
+        client = get_market_data_client(exchange)
         df = client.get_ohlcv_data(symbol, interval, limit)
         
         if df.empty:
@@ -140,7 +140,7 @@ async def get_rsi_data(
     Obtiene datos de RSI (Relative Strength Index)
     """
     try:
-        client = MarketDataClient(exchange_id=exchange)
+        client = get_market_data_client(exchange)
         df = client.get_ohlcv_data(symbol, interval, limit)
         
         if df.empty or len(df) < period + 5:  # Necesitamos suficientes datos
@@ -196,7 +196,7 @@ async def get_bollinger_bands(
     Obtiene datos de Bandas de Bollinger
     """
     try:
-        client = MarketDataClient(exchange_id=exchange)
+        client = get_market_data_client(exchange)
         df = client.get_ohlcv_data(symbol, interval, limit)
         
         if df.empty or len(df) < period + 5:
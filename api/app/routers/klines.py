@@ -2,18 +2,21 @@
 Router para datos OHLCV (Klines)
 """
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request, Response
 from typing import List, Optional, Dict, Any
+import hashlib
+import orjson
 import pandas as pd
 from datetime import datetime
 
 # Importar utilidades
-from app.utils.market_data import MarketDataClient
+from app.utils.market_data import get_market_data_client
 
 router = APIRouter()
 
 @router.get("/klines", response_model=Dict[str, Any])
 async def get_klines(
+    request: Request,
     symbol: str = Query(..., description="Par de trading (ej: BTC/USDT)"),
     interval: str = Query("1h", description="Intervalo de tiempo (ej: 1m, 5m, 15m, 1h, 4h, 1d)"),
     limit: int = Query(100, description="Cantidad de velas a retornar", ge=1, le=1000),
@@ -25,16 +28,28 @@ async def get_klines(
     Este es el endpoint principal para alimentar los gráficos de velas en el frontend.
     """
     try:
-        client = MarketDataClient(exchange_id=exchange)
-        df = client.get_ohlcv_data(symbol, interval, limit, since)
+        client = get_market_data_client(exchange)
+        candles = await client.aget_ohlcv_candles(symbol, interval, limit, since)
         
-        if df.empty:
+        if len(candles) == 0:
             raise HTTPException(
                 status_code=404, 
                 detail=f"No hay datos disponibles para {symbol} en {exchange} con intervalo {interval}"
             )
         
-        # Convertir el DataFrame a formato compatible con Lightweight Charts
+        # ETag calculado a partir de las velas: si el cliente ya tiene estos datos
+        # se responde 304 sin volver a serializar ni enviar el cuerpo
+        times_ms = candles.timestamp_ms()
+        digest = hashlib.blake2b(digest_size=16)
+        for column in (times_ms, candles.open, candles.high, candles.low, candles.close, candles.volume):
+            digest.update(column.tobytes())
+        etag = f'W/"{digest.hexdigest()}"'
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers=headers)
+        
+        # Convertir las velas a formato compatible con Lightweight Charts
         result = {
             "symbol": symbol,
             "interval": interval,
@@ -44,17 +59,17 @@ async def get_klines(
         }
         
         # Formato para Lightweight Charts con objetos individuales por vela
-        for _, row in df.iterrows():
-            result["data"].append({
-                "time": row["timestamp"].value // 10**6,  # Convertir a milisegundos
-                "open": float(row["open"]),
-                "high": float(row["high"]),
-                "low": float(row["low"]),
-                "close": float(row["close"]),
-                "volume": float(row["volume"])
-            })
+        # (se recorren las columnas NumPy directamente, sin iterrows)
+        result["data"] = [
+            {"time": t, "open": o, "high": h, "low": l, "close": c, "volume": v}
+            for t, o, h, l, c, v in zip(
+                times_ms.tolist(), candles.open.tolist(), candles.high.tolist(),
+                candles.low.tolist(), candles.close.tolist(), candles.volume.tolist()
+            )
+        ]
         
-        return result
+        # Serializar con orjson (mucho más rápido que la stdlib con miles de velas)
+        return Response(content=orjson.dumps(result), media_type="application/json", headers=headers)
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error obteniendo datos: {str(e)}")
@@ -72,8 +87,8 @@ async def export_klines(
     Exporta datos OHLCV en formato CSV o JSON para descarga
     """
     try:
-        client = MarketDataClient(exchange_id=exchange)
-        df = client.get_ohlcv_data(symbol, interval, limit)
+        client = get_market_data_client(exchange)
+        df = await client.aget_ohlcv_data(symbol, interval, limit)
         
         if df.empty:
             raise HTTPException(
@@ -129,7 +129,7 @@ class DataBroadcaster:
         
     async def _broadcast_loop(self, interval_seconds: float):
         """Bucle principal que envía datos a intervalos regulares"""
-        from app.utils.market_data import MarketDataClient
+        from app.utils.market_data import get_market_data_client
         
         while not self.should_stop:
             try:
@@ -141,27 +141,41 @@ class DataBroadcaster:
                     await asyncio.sleep(interval_seconds)
                     continue
                 
-                # Procesar cada símbolo
+                # Preparar las peticiones de cada símbolo con suscriptores
+                specs = []
                 for symbol in symbols:
+                    # Si no hay conexiones para este símbolo, saltar
+                    if self.connection_manager.get_connections_count(symbol) == 0:
+                        continue
+                        
+                    # Obtener últimos datos para este símbolo (por defecto de Binance en 1m)
+                    interval = "1m"  # Intervalos más cortos para tiempo real
+                    exchange = "binance"  # Por defecto usamos Binance
+                    symbol_only = symbol
+                    
+                    # Extraer símbolo y exchange si están en formato compuesto "binance:BTC/USDT"
+                    if ":" in symbol:
+                        parts = symbol.split(":")
+                        if len(parts) == 2:
+                            exchange, symbol_only = parts
+                    
+                    specs.append((symbol, exchange, symbol_only, interval))
+                
+                # Obtener el último dato de todos los símbolos de forma concurrente
+                client = get_market_data_client()
+                results = await asyncio.gather(
+                    *[client.aget_market_data(exchange, symbol_only, interval, 1)
+                      for _, exchange, symbol_only, interval in specs],
+                    return_exceptions=True
+                )
+                
+                for (_, exchange, symbol, interval), df in zip(specs, results):
                     try:
-                        # Si no hay conexiones para este símbolo, saltar
-                        if self.connection_manager.get_connections_count(symbol) == 0:
+                        # return_exceptions también devuelve CancelledError, que es
+                        # BaseException y no Exception
+                        if isinstance(df, BaseException):
+                            logger.error(f"Error procesando símbolo {symbol}: {df!r}")
                             continue
-                            
-                        # Obtener últimos datos para este símbolo (por defecto de Binance en 1m)
-                        interval = "1m"  # Intervalos más cortos para tiempo real
-                        exchange = "binance"  # Por defecto usamos Binance
-                        
-                        # Extraer símbolo y exchange si están en formato compuesto "binance:BTC/USDT"
-                        if ":" in symbol:
-                            parts = symbol.split(":")
-                            if len(parts) == 2:
-                                exchange, symbol_only = parts
-                                symbol = symbol_only
-                        
-                        # Obtener último dato
-                        client = MarketDataClient(exchange_id=exchange)
-                        df = client.get_ohlcv_data(symbol, interval, limit=1)
                         
                         if not df.empty:
                             # Crear objeto de datos para enviar
@@ -1,9 +1,10 @@
-from fastapi import Depends, HTTPException, status, Security
+from fastapi import Depends, HTTPException, Request, status, Security
+from fastapi.exceptions import RequestValidationError
 from fastapi.security import OAuth2PasswordBearer, SecurityScopes
 from jose import jwt, JWTError
-from pydantic import ValidationError
+from pydantic import BaseModel, ValidationError
 from sqlalchemy.orm import Session
-from typing import Generator, Optional, List
+from typing import Callable, Generator, Optional, List, Type, TypeVar
 
 from app import models, schemas
 from app.config import settings
@@ -20,6 +21,34 @@ oauth2_scheme = OAuth2PasswordBearer(
     }
 )
 
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+def json_body(schema: Type[ModelT]) -> Callable:
+    """
+    Dependencia que valida el cuerpo JSON con ``schema.model_validate_json``,
+    de modo que pydantic-core parsea y valida en una sola pasada
+    """
+    async def _parse_body(request: Request) -> ModelT:
+        try:
+            return schema.model_validate_json(await request.body())
+        except ValidationError as e:
+            raise RequestValidationError(
+                [{**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)]
+            )
+    return _parse_body
+
+def json_body_openapi(schema: Type[BaseModel]) -> dict:
+    """
+    ``openapi_extra`` para las rutas que usan ``json_body``: al leer el cuerpo a mano
+    FastAPI no lo documenta, así que se declara aquí el requestBody con el esquema
+    """
+    return {
+        "requestBody": {
+            "content": {"application/json": {"schema": schema.model_json_schema()}},
+            "required": True,
+        }
+    }
+
 def get_db() -> Generator:
     """
     Dependencia para obtener una sesión de base de datos
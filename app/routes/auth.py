@@ -73,11 +73,15 @@ async def login_access_token(
     response = RedirectResponse(url="/", status_code=303)
     return response
 
-@router.post("/register", response_model=schemas.User)
+@router.post(
+    "/register",
+    response_model=schemas.User,
+    openapi_extra=deps.json_body_openapi(schemas.UserCreate),
+)
 async def register_user(
     *,
     db: Session = Depends(deps.get_db),
-    user_in: schemas.UserCreate,
+    user_in: schemas.UserCreate = Depends(deps.json_body(schemas.UserCreate)),
 ) -> Any:
     """
     Registrar un nuevo usuario
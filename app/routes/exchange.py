@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
 from typing import Any, List
 
@@ -30,13 +30,24 @@ def read_exchanges(
             .limit(limit)
             .all()
         )
-    return exchanges
+    # Serializar con el adaptador precompilado del mismo esquema que response_model
+    # (que sigue describiendo la respuesta en OpenAPI) y devolverla tal cual
+    return Response(
+        content=schemas.ExchangeListAdapter.dump_json(
+            schemas.ExchangeListAdapter.validate_python(exchanges, from_attributes=True)
+        ),
+        media_type="application/json",
+    )
 
-@router.post("/", response_model=schemas.Exchange)
+@router.post(
+    "/",
+    response_model=schemas.Exchange,
+    openapi_extra=deps.json_body_openapi(schemas.ExchangeCreate),
+)
 def create_exchange(
     *,
     db: Session = Depends(deps.get_db),
-    exchange_in: schemas.ExchangeCreate,
+    exchange_in: schemas.ExchangeCreate = Depends(deps.json_body(schemas.ExchangeCreate)),
     current_user: models.User = Depends(deps.get_current_active_user),
 ) -> Any:
     """
@@ -108,12 +119,16 @@ def read_exchange(
     
     return exchange
 
-@router.put("/{exchange_id}", response_model=schemas.Exchange)
+@router.put(
+    "/{exchange_id}",
+    response_model=schemas.Exchange,
+    openapi_extra=deps.json_body_openapi(schemas.ExchangeUpdate),
+)
 def update_exchange(
     *,
     db: Session = Depends(deps.get_db),
     exchange_id: int,
-    exchange_in: schemas.ExchangeUpdate,
+    exchange_in: schemas.ExchangeUpdate = Depends(deps.json_body(schemas.ExchangeUpdate)),
     current_user: models.User = Depends(deps.get_current_active_user),
 ) -> Any:
     """
@@ -135,7 +150,7 @@ def update_exchange(
         )
     
     # Actualizar campos
-    update_data = exchange_in.dict(exclude_unset=True)
+    update_data = exchange_in.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(exchange, field, value)
     
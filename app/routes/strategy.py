@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
 from typing import Any, List, Optional
 
@@ -33,13 +33,24 @@ def read_strategies(
     # Obtener resultados paginados
     strategies = query.order_by(models.Strategy.created_at.desc()).offset(skip).limit(limit).all()
     
-    return strategies
+    # Serializar con el adaptador precompilado del mismo esquema que response_model
+    # (que sigue describiendo la respuesta en OpenAPI) y devolverla tal cual
+    return Response(
+        content=schemas.StrategyListAdapter.dump_json(
+            schemas.StrategyListAdapter.validate_python(strategies, from_attributes=True)
+        ),
+        media_type="application/json",
+    )
 
-@router.post("/", response_model=schemas.Strategy)
+@router.post(
+    "/",
+    response_model=schemas.Strategy,
+    openapi_extra=deps.json_body_openapi(schemas.StrategyCreate),
+)
 def create_strategy(
     *,
     db: Session = Depends(deps.get_db),
-    strategy_in: schemas.StrategyCreate,
+    strategy_in: schemas.StrategyCreate = Depends(deps.json_body(schemas.StrategyCreate)),
     current_user: models.User = Depends(deps.get_current_active_user),
 ) -> Any:
     """
@@ -75,7 +86,7 @@ def create_strategy(
     
     # Crear estrategia
     strategy = models.Strategy(
-        **strategy_in.dict(),
+        **strategy_in.model_dump(),
         user_id=current_user.id,
         total_trades=0,
         win_rate=0.0,
@@ -119,12 +130,16 @@ def read_strategy(
     
     return strategy
 
-@router.put("/{strategy_id}", response_model=schemas.Strategy)
+@router.put(
+    "/{strategy_id}",
+    response_model=schemas.Strategy,
+    openapi_extra=deps.json_body_openapi(schemas.StrategyUpdate),
+)
 def update_strategy(
     *,
     db: Session = Depends(deps.get_db),
     strategy_id: int,
-    strategy_in: schemas.StrategyUpdate,
+    strategy_in: schemas.StrategyUpdate = Depends(deps.json_body(schemas.StrategyUpdate)),
     current_user: models.User = Depends(deps.get_current_active_user),
 ) -> Any:
     """
@@ -161,7 +176,7 @@ def update_strategy(
             )
     
     # Actualizar campos
-    update_data = strategy_in.dict(exclude_unset=True)
+    update_data = strategy_in.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(strategy, field, value)
     
@@ -204,12 +219,16 @@ def delete_strategy(
     
     # Cuando se usa status_code=204, no se debe devolver nada
 
-@router.post("/{strategy_id}/trades", response_model=schemas.Trade)
+@router.post(
+    "/{strategy_id}/trades",
+    response_model=schemas.Trade,
+    openapi_extra=deps.json_body_openapi(schemas.TradeCreate),
+)
 def create_trade(
     *,
     db: Session = Depends(deps.get_db),
     strategy_id: int,
-    trade_in: schemas.TradeCreate,
+    trade_in: schemas.TradeCreate = Depends(deps.json_body(schemas.TradeCreate)),
     current_user: models.User = Depends(deps.get_current_active_user),
 ) -> Any:
     """
@@ -229,7 +248,7 @@ def create_trade(
     
     # Crear el trade (asumiendo que existe el modelo Trade)
     trade = models.Trade(
-        **trade_in.dict(),
+        **trade_in.model_dump(),
         strategy_id=strategy_id,
         is_closed=False,
         entry_time=datetime.utcnow(),
@@ -277,4 +296,11 @@ def read_trades(
         .all()
     )
     
-    return trades
+    # Serializar con el adaptador precompilado del mismo esquema que response_model
+    # (que sigue describiendo la respuesta en OpenAPI) y devolverla tal cual
+    return Response(
+        content=schemas.TradeListAdapter.dump_json(
+            schemas.TradeListAdapter.validate_python(trades, from_attributes=True)
+        ),
+        media_type="application/json",
+    )
@@ -16,7 +16,8 @@ from app.schemas.exchange import (
     ExchangeCreate,
     ExchangeUpdate,
     ExchangeInDB,
-    Exchange
+    Exchange,
+    ExchangeListAdapter
 )
 
 from app.schemas.strategy import (
@@ -29,5 +30,16 @@ from app.schemas.strategy import (
     TradeCreate,
     TradeUpdate,
     TradeInDB,
-    Trade
+    Trade,
+    StrategyListAdapter,
+    TradeListAdapter
 )
+
+__all__ = [
+    "UserBase", "UserCreate", "UserUpdate", "UserInDB", "User", "Token", "TokenData",
+    "ExchangeBase", "ExchangeCreate", "ExchangeUpdate", "ExchangeInDB", "Exchange",
+    "ExchangeListAdapter",
+    "StrategyBase", "StrategyCreate", "StrategyUpdate", "StrategyInDB", "Strategy",
+    "TradeBase", "TradeCreate", "TradeUpdate", "TradeInDB", "Trade",
+    "StrategyListAdapter", "TradeListAdapter",
+]
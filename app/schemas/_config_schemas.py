@@ -0,0 +1,10 @@
+# Validación compartida para los campos JSON opacos (config / params)
+
+def validate_json_object(v):
+    """
+    Comprobar que un blob JSON opaco es un objeto (dict) o None.
+    Solo se comprueba el tipo de nivel superior: el contenido no se recorre.
+    """
+    if v is not None and not isinstance(v, dict):
+        raise ValueError("Debe ser un objeto JSON")
+    return v
@@ -1,25 +1,33 @@
-from pydantic import BaseModel, validator
-from typing import Optional, Dict, Any
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator
+from typing import Optional, Any, List
 from datetime import datetime
 
+from app.schemas._config_schemas import validate_json_object
+
+# Tipos de exchange admitidos (frozenset para comprobación O(1) en el validador)
+_ALLOWED_EXCHANGE_TYPES = frozenset({"binance", "bingx", "bybit", "bitget", "coinbase", "kraken"})
+
 # Esquemas compartidos
 class ExchangeBase(BaseModel):
     name: str
     exchange_type: str
     is_active: bool = True
-    config: Optional[Dict[str, Any]] = {}
+    config: Any = Field(default_factory=dict)  # JSON opaco: Any evita recorrerlo al validar
 
 # Esquemas para crear y actualizar
 class ExchangeCreate(ExchangeBase):
     api_key: str
     api_secret: str
     
-    @validator('exchange_type')
+    @field_validator('exchange_type')
+    @classmethod
     def validate_exchange_type(cls, v):
-        allowed_types = ["binance", "bingx", "bybit", "bitget", "coinbase", "kraken"]
-        if v.lower() not in allowed_types:
-            raise ValueError(f"Exchange type debe ser uno de: {', '.join(allowed_types)}")
-        return v.lower()
+        v = v.lower()
+        if v not in _ALLOWED_EXCHANGE_TYPES:
+            raise ValueError(f"Exchange type debe ser uno de: {', '.join(sorted(_ALLOWED_EXCHANGE_TYPES))}")
+        return v
+    
+    validate_config = field_validator('config')(validate_json_object)
 
 class ExchangeUpdate(BaseModel):
     name: Optional[str] = None
@@ -27,7 +35,9 @@ class ExchangeUpdate(BaseModel):
     is_active: Optional[bool] = None
     api_key: Optional[str] = None
     api_secret: Optional[str] = None
-    config: Optional[Dict[str, Any]] = None
+    config: Any = None
+    
+    validate_config = field_validator('config')(validate_json_object)
 
 # Esquemas para respuestas
 class ExchangeInDB(ExchangeBase):
@@ -36,10 +46,12 @@ class ExchangeInDB(ExchangeBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 class Exchange(ExchangeInDB):
     # Excluir datos sensibles
     api_key: str = "********"
     api_secret: str = "********"
+
+# Adaptador reutilizable para serializar listas de respuesta (se construye una sola vez)
+ExchangeListAdapter = TypeAdapter(List[Exchange])
@@ -1,7 +1,13 @@
-from pydantic import BaseModel, validator
-from typing import Optional, Dict, Any, List
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator
+from typing import Optional, Any, List
 from datetime import datetime
 
+from app.schemas._config_schemas import validate_json_object
+
+# Timeframes admitidos (tupla ordenada para los mensajes, frozenset para la comprobación)
+_TIMEFRAMES = ("1m", "3m", "5m", "15m", "30m", "1h", "2h", "4h", "6h", "8h", "12h", "1d", "3d", "1w", "1M")
+_ALLOWED_TIMEFRAMES = frozenset(_TIMEFRAMES)
+
 # Esquemas compartidos
 class StrategyBase(BaseModel):
     name: str
@@ -12,16 +18,18 @@ class StrategyBase(BaseModel):
     is_active: bool = False
     is_backtesting: bool = False
     is_live: bool = False
-    params: Optional[Dict[str, Any]] = {}
+    params: Any = Field(default_factory=dict)  # JSON opaco: Any evita recorrerlo al validar
 
 # Esquemas para crear y actualizar
 class StrategyCreate(StrategyBase):
-    @validator('timeframe')
+    @field_validator('timeframe')
+    @classmethod
     def validate_timeframe(cls, v):
-        allowed_timeframes = ["1m", "3m", "5m", "15m", "30m", "1h", "2h", "4h", "6h", "8h", "12h", "1d", "3d", "1w", "1M"]
-        if v not in allowed_timeframes:
-            raise ValueError(f"Timeframe debe ser uno de: {', '.join(allowed_timeframes)}")
+        if v not in _ALLOWED_TIMEFRAMES:
+            raise ValueError(f"Timeframe debe ser uno de: {', '.join(_TIMEFRAMES)}")
         return v
+    
+    validate_params = field_validator('params')(validate_json_object)
 
 class StrategyUpdate(BaseModel):
     name: Optional[str] = None
@@ -32,7 +40,9 @@ class StrategyUpdate(BaseModel):
     is_active: Optional[bool] = None
     is_backtesting: Optional[bool] = None
     is_live: Optional[bool] = None
-    params: Optional[Dict[str, Any]] = None
+    params: Any = None
+    
+    validate_params = field_validator('params')(validate_json_object)
 
 # Esquemas para respuestas
 class StrategyInDB(StrategyBase):
@@ -44,10 +54,9 @@ class StrategyInDB(StrategyBase):
     win_rate: float
     profit_factor: float
     max_drawdown: float
-    performance: Dict[str, Any]
+    performance: Any
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 class Strategy(StrategyInDB):
     pass
@@ -81,8 +90,11 @@ class TradeInDB(TradeBase):
     profit_loss: float
     profit_loss_percent: float
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 class Trade(TradeInDB):
     pass
+
+# Adaptadores reutilizables para serializar listas de respuesta (se construyen una sola vez)
+StrategyListAdapter = TypeAdapter(List[Strategy])
+TradeListAdapter = TypeAdapter(List[Trade])
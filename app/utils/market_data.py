@@ -6,15 +6,334 @@ exclusivamente a través de CCXT para mayor compatibilidad y robustez
 import os
 import time
 import json
+import asyncio
+import logging
+import functools
+import hashlib
+import threading
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, fields
+from pathlib import Path
+from types import MappingProxyType
 import numpy as np
-from datetime import datetime, timedelta
-import pandas as pd
-import ccxt
+from datetime import datetime
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+# orjson es opcional: si está instalado se usa para decodificar JSON, si no la stdlib
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Sesión HTTP compartida por todos los clientes CCXT: reutiliza conexiones TCP/TLS
+# entre peticiones en lugar de abrir una nueva en cada llamada. Solo se reintentan los
+# fallos de conexión y de lectura: las respuestas de error (429, 5xx) llegan a CCXT,
+# que las traduce a RateLimitExceeded, DDoSProtection, etc. con el cuerpo del exchange
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=64,
+    max_retries=Retry(
+        connect=3, read=2, status=0, backoff_factor=0.2,
+        raise_on_status=False, respect_retry_after_header=False,
+    ),
+))
+
+# ccxt y pandas se importan en el primer uso: ccxt carga cientos de módulos de
+# exchanges y ambos suman cientos de ms al arranque de cada worker
+
+@functools.lru_cache(maxsize=None)
+def _ccxt_exchanges():
+    """Exchanges soportados por CCXT (frozenset para comprobar pertenencia en O(1))"""
+    import ccxt
+    return frozenset(ccxt.exchanges)
+
+_EXCHANGES_CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'exchanges.json')
+_EXCHANGES_CONFIG = (None, {})  # (mtime del archivo, configuración parseada)
+
+def _load_exchanges_config():
+    """Configuración de exchanges.json ({} si no existe); solo se vuelve a leer si el archivo cambia"""
+    global _EXCHANGES_CONFIG
+    try:
+        mtime = os.stat(_EXCHANGES_CONFIG_PATH).st_mtime_ns
+    except OSError:
+        return {}
+    if _EXCHANGES_CONFIG[0] != mtime:
+        with open(_EXCHANGES_CONFIG_PATH, 'rb') as f:
+            _EXCHANGES_CONFIG = (mtime, _json_loads(f.read()))
+    return _EXCHANGES_CONFIG[1]
+
+# Exchanges más populares, que se listan primero
+_POPULAR_EXCHANGES = ('binance', 'bybit', 'kucoin', 'okx', 'coinbase', 'kraken', 'bitget', 'mexc')
+
+@functools.lru_cache(maxsize=None)
+def _available_exchanges():
+    """Exchanges de CCXT con los populares primero (se calcula una sola vez)"""
+    import ccxt
+    popular = frozenset(_POPULAR_EXCHANGES)
+    return _POPULAR_EXCHANGES + tuple(ex for ex in ccxt.exchanges if ex not in popular)
+
+# Duración en minutos de los timeframes en formato estándar de CCXT
+# (la mayoría de exchanges los soportan)
+_TF_MINUTES = MappingProxyType({
+    '1m': 1, '3m': 3, '5m': 5, '15m': 15, '30m': 30,
+    '1h': 60, '2h': 120, '4h': 240, '6h': 360, '8h': 480, '12h': 720,
+    '1d': 1440, '3d': 4320, '1w': 10080, '1M': 43200
+})
+
+# Timeframe aceptado -> formato de CCXT: los estándar se mapean a sí mismos y las
+# conversiones comunes desde minutos se añaden (ambos conjuntos de claves son disjuntos)
+_TF_TO_CCXT = MappingProxyType({
+    **{tf: tf for tf in _TF_MINUTES},
+    '1': '1m', '5': '5m', '15': '15m', '30': '30m',
+    '60': '1h', '120': '2h', '240': '4h',
+    '1440': '1d', '10080': '1w', '43200': '1M'
+})
+
+# Máximo de velas que devuelve cada exchange por llamada a fetch_ohlcv; las peticiones
+# mayores se dividen en varias llamadas consecutivas con since creciente
+_OHLCV_LIMITS = MappingProxyType({
+    'binance': 1000, 'bybit': 200, 'bitstamp': 1000, 'kucoin': 500, 'okx': 300
+})
+_OHLCV_DEFAULT_LIMIT = 500
+
+# Caché incremental en disco de las velas (un .npy por exchange/símbolo/timeframe):
+# las consultas sin since solo descargan las velas posteriores a la última guardada
+# (también la de ventanas históricas, ver _OHLCV_HISTORY_TTL). Con TR_OHLCV_DISK_CACHE=0
+# no se lee ni se escribe nada en disco y las velas se descargan siempre
+_OHLCV_DISK_CACHE = os.environ.get('TR_OHLCV_DISK_CACHE') != '0'
+_OHLCV_DISK_DIR = Path.home() / '.cache' / 'tradingroad' / 'ohlcv'
+_OHLCV_DISK_MAX_ROWS = 5000
+
+def _save_ohlcv_rows(path, rows, symbol):
+    """Guardar filas OHLCV en un .npy; escritura atómica para que otro proceso nunca lea un archivo a medias"""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f'.{os.getpid()}.tmp.npy')
+        np.save(tmp_path, rows)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning("No se pudo guardar la caché de velas de %s: %s", symbol, e)
+
+# Caché en disco de las consultas con since (un .npy por exchange/símbolo/timeframe/since/
+# limit). Las ventanas completas y cerradas no cambian y no caducan; las que llegan al
+# presente solo valen _OHLCV_HISTORY_TTL segundos. Por encima de _OHLCV_HISTORY_MAX_FILES
+# archivos se borran los de mtime más antiguo
+_OHLCV_HISTORY_TTL = 60
+_OHLCV_HISTORY_MAX_FILES = 2000
+
+def _evict_ohlcv_history(directory):
+    """Borrar los archivos más antiguos (por mtime) de directory si se supera _OHLCV_HISTORY_MAX_FILES"""
+    try:
+        entries = []
+        for entry in os.scandir(directory):
+            if entry.name.endswith('.npy') and not entry.name.endswith('.tmp.npy'):
+                entries.append((entry.stat().st_mtime, entry.path))
+    except OSError:
+        return
+    if len(entries) <= _OHLCV_HISTORY_MAX_FILES:
+        return
+    entries.sort()
+    for _, path in entries[:len(entries) - _OHLCV_HISTORY_MAX_FILES]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass  # Ya borrado por otro proceso
+
+def _ohlcv_array(ohlcv):
+    """Filas OHLCV de CCXT como array float64 de forma (n, 6)"""
+    try:
+        return np.asarray(ohlcv, dtype=np.float64)
+    except TypeError:
+        # Algunos exchanges devuelven None (p. ej. volumen); pasan a NaN
+        return np.asarray(ohlcv, dtype=object).astype(np.float64)
+
+def _merge_ohlcv_rows(pages):
+    """Unir páginas de filas OHLCV en un array ordenado por timestamp y sin velas repetidas"""
+    pages = [_ohlcv_array(page) for page in pages if len(page)]
+    if not pages:
+        return np.empty((0, 6))
+    rows = np.concatenate(pages)
+    rows = rows[np.argsort(rows[:, 0], kind='stable')]
+    # De cada timestamp repetido se queda la última fila recibida (la más actualizada)
+    return rows[np.append(rows[1:, 0] != rows[:-1, 0], True)]
+
+# Tipo de los precios y volúmenes de las velas. Con TR_OHLCV_F32=1 se usa float32, la
+# mitad de memoria por vela (suficiente para mostrar gráficos); los timestamps se
+# mantienen siempre en datetime64 porque float32 no representa milisegundos actuales
+_OHLCV_DTYPE = np.float32 if os.environ.get('TR_OHLCV_F32') == '1' else np.float64
+
+# Caché en memoria de pares por exchange: {exchange_id: (timestamp, pares)}
+# Los mercados cambian como mucho una vez al día, así que una hora de validez es segura
+_PAIRS_CACHE = {}
+_PAIRS_CACHE_TTL = 3600
+
+# Precio base y volatilidad por activo para los datos simulados: {activo: (precio, volatilidad)}
+_MOCK_PRICES = MappingProxyType({
+    'BTC': (65000, 1200),
+    'ETH': (3200, 180),
+    'BNB': (570, 15),
+    'SOL': (146, 8),
+    'XRP': (0.50, 0.03),
+    'ADA': (0.45, 0.025),
+})
+_MOCK_DEFAULT_PRICE = (100, 5)
+
+# Monedas de cotización de los pares que se ofrecen en get_available_pairs
+_PAIR_QUOTES = frozenset({'USDT', 'BUSD', 'USDC'})
+
+# Lista predeterminada de pares comunes
+_DEFAULT_PAIRS = (
+    'BTC/USDT', 'ETH/USDT', 'BNB/USDT', 'SOL/USDT', 
+    'ADA/USDT', 'XRP/USDT', 'DOT/USDT', 'AVAX/USDT',
+    'DOGE/USDT', 'SHIB/USDT', 'MATIC/USDT', 'LTC/USDT'
+)
+
+# Caché LRU de velas ya descargadas: {clave: (instante de expiración, Candles)}
+# Si la última vela sigue abierta los datos cambian continuamente y solo se guardan
+# _OHLCV_CACHE_TTL segundos; si todas las velas están cerradas se guardan hasta que
+# cierra la vela siguiente (o un timeframe si es una ventana histórica completa)
+_OHLCV_CACHE = OrderedDict()
+_OHLCV_CACHE_MAXSIZE = 512
+_OHLCV_CACHE_TTL = 5.0
+_OHLCV_CACHE_LOCK = threading.Lock()
+
+def _ohlcv_cache_get(key):
+    """Devolver las velas cacheadas para key si siguen vigentes, o None"""
+    with _OHLCV_CACHE_LOCK:
+        entry = _OHLCV_CACHE.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() >= entry[0]:
+            del _OHLCV_CACHE[key]
+            return None
+        _OHLCV_CACHE.move_to_end(key)
+        return entry[1]
+
+def _ohlcv_cache_put(key, candles, ttl=_OHLCV_CACHE_TTL):
+    """Guardar velas en la caché; los arrays pasan a solo lectura para poder compartirlos sin copia"""
+    for field in fields(candles):
+        getattr(candles, field.name).flags.writeable = False
+    with _OHLCV_CACHE_LOCK:
+        _OHLCV_CACHE[key] = (time.monotonic() + ttl, candles)
+        _OHLCV_CACHE.move_to_end(key)
+        while len(_OHLCV_CACHE) > _OHLCV_CACHE_MAXSIZE:
+            _OHLCV_CACHE.popitem(last=False)
+
+# Caché en disco de los mercados de CCXT: load_markets es una petición HTTPS de cientos
+# de ms (o segundos) que se repetiría en cada arranque de proceso
+_MARKETS_CACHE_DIR = Path.home() / '.cache' / 'tradingroad' / 'markets'
+_MARKETS_CACHE_TTL = 86400
+
+def _load_markets_cached(client, exchange_id):
+    """Cargar los mercados de client desde la caché en disco o, si no está vigente, por HTTPS"""
+    import ccxt
+    # La versión de CCXT forma parte del nombre: el formato de los mercados cambia entre versiones
+    path = _MARKETS_CACHE_DIR / f'{exchange_id}-{ccxt.__version__}.json'
+    try:
+        if time.time() - path.stat().st_mtime < _MARKETS_CACHE_TTL:
+            client.set_markets(_json_loads(path.read_bytes()))
+            return
+    except (OSError, ValueError):
+        pass  # Sin caché o caché corrupta: se descargan de nuevo
+    
+    client.load_markets()
+    try:
+        # Escritura atómica para que otro proceso nunca lea un archivo a medias
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f'.{os.getpid()}.tmp')
+        tmp_path.write_text(json.dumps(client.markets, default=str))
+        os.replace(tmp_path, path)
+    except (OSError, TypeError, ValueError) as e:
+        logger.warning("No se pudo guardar la caché de mercados de %s: %s", exchange_id, e)
+
+# Clientes CCXT públicos (sin credenciales) por exchange, solo para metadatos como los
+# mercados: se crean una vez por proceso y conservan los mercados ya cargados
+_PUBLIC_CLIENTS = {}
+_PUBLIC_CLIENTS_LOCK = threading.Lock()
+
+def _public_ccxt_client(exchange_id):
+    """Cliente CCXT público compartido para exchange_id (None si CCXT no lo soporta)"""
+    if exchange_id not in _ccxt_exchanges():
+        return None
+    with _PUBLIC_CLIENTS_LOCK:
+        client = _PUBLIC_CLIENTS.get(exchange_id)
+        if client is None:
+            import ccxt
+            client = _PUBLIC_CLIENTS[exchange_id] = getattr(ccxt, exchange_id)({
+                'enableRateLimit': True,
+                'timeout': 30000,
+                'session': _SESSION,
+            })
+    return client
+
+# Clientes con una sesión ccxt.async_support abierta (se cierran con aclose_all)
+_ASYNC_CLIENTS = weakref.WeakSet()
+
+@dataclass(frozen=True, slots=True)
+class Candles:
+    """Velas OHLCV en formato columnar: un array NumPy por campo"""
+    timestamp: np.ndarray  # datetime64[ns]
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+    
+    def __len__(self):
+        return len(self.timestamp)
+    
+    def timestamp_ms(self):
+        """Timestamps como int64 en milisegundos UNIX (formato de CCXT y de los gráficos)"""
+        return self.timestamp.astype('datetime64[ms]').astype(np.int64)
+    
+    def to_df(self, dtype_backend=None):
+        """
+        Convertir a DataFrame con columnas [timestamp, open, high, low, close, volume]
+        
+        Con dtype_backend='pyarrow' las columnas pasan a tipos Arrow (menos memoria y
+        serialización más barata); requiere pandas>=2.0 y pyarrow, y si no están
+        disponibles se mantienen las columnas NumPy.
+        """
+        import pandas as pd
+        # copy=False: pandas adopta los arrays (ya contiguos) en lugar de copiarlos a un
+        # bloque consolidado. Los de la caché son de solo lectura y compartidos, así que
+        # esos se copian: el DataFrame es siempre modificable (p. ej. para añadir
+        # indicadores in-place) sin tocar las velas cacheadas
+        columns = {field.name: getattr(self, field.name) for field in fields(self)}
+        df = pd.DataFrame({
+            name: column if column.flags.writeable else column.copy()
+            for name, column in columns.items()
+        }, copy=False)
+        if dtype_backend == 'pyarrow':
+            try:
+                df = df.convert_dtypes(dtype_backend='pyarrow')
+            except (ImportError, TypeError):
+                pass  # pyarrow no instalado o pandas < 2.0
+        return df
 
 class MarketDataClient:
     """Cliente para obtener datos de mercado exclusivamente a través de CCXT"""
     
+    # Atributos fijos: sin __dict__ por instancia (__weakref__ para _ASYNC_CLIENTS)
+    __slots__ = (
+        'exchange_id', 'api_key', 'api_secret', 'api_password',
+        'ccxt_client', '_async_clients', '__weakref__'
+    )
+    
     def __init__(self, exchange_id="binance", api_key=None, api_secret=None):
+        # Con __slots__ todos los atributos deben existir aunque la configuración no los aporte
+        self.api_key = None
+        self.api_secret = None
+        self.api_password = None
+        
         # Manejo de casos donde se pasa un diccionario de configuración completo
         if isinstance(exchange_id, dict):
             config = exchange_id
@@ -38,7 +357,7 @@ class MarketDataClient:
                     self.api_secret = exchange_config.get('api_secret')
                     self.api_password = exchange_config.get('password')
             except Exception as e:
-                print(f"Error al extraer configuración del diccionario: {e}")
+                logger.error("Error al extraer configuración del diccionario: %s", e)
         else:
             # Manejo normal cuando se pasa un string
             self.exchange_id = str(exchange_id).lower()
@@ -46,41 +365,41 @@ class MarketDataClient:
             self.api_secret = api_secret
             
         self.ccxt_client = None
+        # Clientes ccxt.async_support por event loop, creados en el primer uso en cada uno
+        self._async_clients = weakref.WeakKeyDictionary()
         
-        # Intentar cargar configuración desde archivo si existe
+        # Intentar cargar configuración desde archivo si existe (se lee una vez por proceso)
         try:
-            config_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'exchanges.json')
-            if os.path.exists(config_path):
-                with open(config_path, 'r') as f:
-                    exchanges_config = json.load(f)
-                    
-                    # Buscar configuración en formato antiguo
-                    if self.exchange_id in exchanges_config and not api_key and not api_secret:
-                        self.api_key = exchanges_config[self.exchange_id].get('api_key')
-                        self.api_secret = exchanges_config[self.exchange_id].get('api_secret')
-                    # Buscar configuración en formato nuevo (ccxt.exchanges)
-                    elif 'ccxt' in exchanges_config and 'exchanges' in exchanges_config['ccxt'] and \
-                         self.exchange_id in exchanges_config['ccxt']['exchanges']:
-                        exchange_config = exchanges_config['ccxt']['exchanges'][self.exchange_id]
-                        self.api_key = exchange_config.get('api_key')
-                        self.api_secret = exchange_config.get('api_secret')
-                        self.api_password = exchange_config.get('password')  # Algunos exchanges requieren password
+            exchanges_config = _load_exchanges_config()
+            
+            # Buscar configuración en formato antiguo
+            if self.exchange_id in exchanges_config and not api_key and not api_secret:
+                self.api_key = exchanges_config[self.exchange_id].get('api_key')
+                self.api_secret = exchanges_config[self.exchange_id].get('api_secret')
+            # Buscar configuración en formato nuevo (ccxt.exchanges)
+            elif 'ccxt' in exchanges_config and 'exchanges' in exchanges_config['ccxt'] and \
+                 self.exchange_id in exchanges_config['ccxt']['exchanges']:
+                exchange_config = exchanges_config['ccxt']['exchanges'][self.exchange_id]
+                self.api_key = exchange_config.get('api_key')
+                self.api_secret = exchange_config.get('api_secret')
+                self.api_password = exchange_config.get('password')  # Algunos exchanges requieren password
         except Exception as e:
-            print(f"Error al cargar configuración de exchanges: {e}")
+            logger.error("Error al cargar configuración de exchanges: %s", e)
         
         # Inicializar cliente CCXT
         self._init_ccxt_client()
     
     def _init_ccxt_client(self):
         """Inicializar el cliente CCXT para el exchange configurado"""
-        if self.exchange_id in ccxt.exchanges:
+        if self.exchange_id in _ccxt_exchanges():
             try:
+                import ccxt
                 exchange_class = getattr(ccxt, self.exchange_id)
                 
                 # Asegurar que api_key y api_secret estén inicializados
-                if not hasattr(self, 'api_key') or self.api_key is None:
+                if self.api_key is None:
                     self.api_key = ""
-                if not hasattr(self, 'api_secret') or self.api_secret is None:
+                if self.api_secret is None:
                     self.api_secret = ""
                 
                 config = {
@@ -88,61 +407,53 @@ class MarketDataClient:
                     'secret': self.api_secret,
                     'enableRateLimit': True,
                     'timeout': 30000,
+                    'session': _SESSION,
                 }
                 
                 # Añadir password si existe (necesario para algunos exchanges como KuCoin)
-                if hasattr(self, 'api_password') and self.api_password:
+                if self.api_password:
                     config['password'] = self.api_password
                     
                 self.ccxt_client = exchange_class(config)
-                print(f"Cliente CCXT para {self.exchange_id} inicializado correctamente")
+                logger.debug("Cliente CCXT para %s inicializado correctamente", self.exchange_id)
             except Exception as e:
-                print(f"Error al inicializar cliente CCXT para {self.exchange_id}: {e}")
+                logger.error("Error al inicializar cliente CCXT para %s: %s", self.exchange_id, e)
                 self._fallback_to_binance()
         else:
-            print(f"Error: Exchange {self.exchange_id} no soportado por CCXT")
+            logger.error("Exchange %s no soportado por CCXT", self.exchange_id)
             self._fallback_to_binance()
     
     def _fallback_to_binance(self):
         """Usar Binance como fallback si el exchange solicitado no está disponible"""
+        import ccxt
         self.exchange_id = "binance"  # Fallback a Binance
         self.ccxt_client = ccxt.binance({
             'apiKey': None,
             'secret': None,
             'enableRateLimit': True,
             'timeout': 30000,
+            'session': _SESSION,
         })
-        print(f"Cliente CCXT para {self.exchange_id} (fallback) inicializado correctamente")
+        logger.warning("Cliente CCXT para %s (fallback) inicializado correctamente", self.exchange_id)
     
     def _timeframe_to_interval(self, timeframe):
         """Convertir formato de timeframe al formato estándar de CCXT"""
-        # CCXT usa un formato estándar para timeframes que la mayoría de exchanges soportan
-        standard_timeframes = {
-            '1m': '1m', '3m': '3m', '5m': '5m', '15m': '15m', '30m': '30m',
-            '1h': '1h', '2h': '2h', '4h': '4h', '6h': '6h', '8h': '8h', '12h': '12h',
-            '1d': '1d', '3d': '3d', '1w': '1w', '1M': '1M'
-        }
-        
-        # Si el timeframe ya está en formato estándar CCXT
-        if timeframe in standard_timeframes:
-            return timeframe
-        
-        # Intentar hacer algunas conversiones comunes
-        conversions = {
-            '1': '1m', '5': '5m', '15': '15m', '30': '30m',
-            '60': '1h', '120': '2h', '240': '4h',
-            '1440': '1d', '10080': '1w', '43200': '1M'
-        }
-        
-        if timeframe in conversions:
-            return conversions[timeframe]
-            
         # Si no se puede convertir, devolver el timeframe original
         # (CCXT intentará adaptarlo según el exchange)
-        return timeframe
+        return _TF_TO_CCXT.get(timeframe, timeframe)
+        
+    def get_ohlcv_data(self, symbol, timeframe='1h', limit=100, since=None, dtype_backend=None):
+        """Obtener datos OHLCV a través de CCXT como DataFrame (ver Candles.to_df)"""
+        return self.get_ohlcv_candles(symbol, timeframe, limit, since).to_df(dtype_backend)
+    
+    def get_ohlcv_candles(self, symbol, timeframe='1h', limit=100, since=None):
+        """Obtener datos OHLCV a través de CCXT como arrays NumPy (Candles)"""
+        # Devolver las velas cacheadas si la misma consulta se hizo hace unos segundos
+        cache_key = (self.exchange_id, symbol, timeframe, limit, since)
+        candles = _ohlcv_cache_get(cache_key)
+        if candles is not None:
+            return candles
         
-    def get_ohlcv_data(self, symbol, timeframe='1h', limit=100, since=None):
-        """Obtener datos OHLCV a través de CCXT"""
         try:
             # Asegurarse de que tenemos un cliente CCXT válido
             if not self.ccxt_client:
@@ -150,162 +461,516 @@ class MarketDataClient:
                 
             # Verificar si el exchange soporta OHLCV
             if not self.ccxt_client.has['fetchOHLCV']:
-                print(f"Exchange {self.exchange_id} no soporta OHLCV")
-                return self.generate_mock_data(symbol, timeframe, limit)
+                logger.warning("Exchange %s no soporta OHLCV", self.exchange_id)
+                return self.generate_mock_candles(symbol, timeframe, limit)
+            
+            # fetch_ohlcv carga los mercados en la primera llamada: usar la caché en disco
+            if not self.ccxt_client.markets:
+                _load_markets_cached(self.ccxt_client, self.exchange_id)
             
             # Convertir timeframe al formato estándar de CCXT
             tf = self._timeframe_to_interval(timeframe)
             
-            # Obtener datos OHLCV
-            ohlcv = self.ccxt_client.fetch_ohlcv(symbol, tf, limit=limit, since=since)
-            
-            # Verificar si se obtuvieron datos
-            if not ohlcv or len(ohlcv) == 0:
-                print(f"No se obtuvieron datos para {symbol} en {self.exchange_id}")
-                return self.generate_mock_data(symbol, timeframe, limit)
-            
-            # Convertir a DataFrame
-            df = pd.DataFrame(ohlcv, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
-            df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-            
-            # Asegurar que está ordenado por timestamp
-            df = df.sort_values('timestamp')
+            # Obtener datos OHLCV: las últimas velas se completan desde la caché en disco
+            if not _OHLCV_DISK_CACHE:
+                ohlcv = self._fetch_ohlcv(symbol, tf, limit, since)
+            elif since is None:
+                ohlcv = self._fetch_ohlcv_incremental(symbol, tf, limit)
+            else:
+                ohlcv = self._fetch_ohlcv_history(symbol, tf, limit, since)
             
-            return df
+            return self._build_candles(ohlcv, cache_key, symbol, timeframe, limit)
                 
         except Exception as e:
-            print(f"Error al obtener datos de {self.exchange_id} via CCXT: {str(e)}")
-            return self.generate_mock_data(symbol, timeframe, limit)
+            logger.error("Error al obtener datos de %s via CCXT: %s", self.exchange_id, e)
+            return self.generate_mock_candles(symbol, timeframe, limit)
+    
+    def _fetch_ohlcv(self, symbol, tf, limit, since):
+        """Descargar velas OHLCV (en varias llamadas si se supera el límite del exchange)"""
+        pages = self._ohlcv_pages(self.ccxt_client, tf, limit, since)
+        try:
+            page_since, page_limit = next(pages)
+            while True:
+                page = self.ccxt_client.fetch_ohlcv(symbol, tf, limit=page_limit, since=page_since)
+                page_since, page_limit = pages.send(page)
+        except StopIteration as stop:
+            return stop.value
+    
+    def _fetch_ohlcv_incremental(self, symbol, tf, limit):
+        """Últimas limit velas descargando solo las posteriores a las guardadas en disco"""
+        # El timeframe forma parte del nombre del archivo: solo se cachean los conocidos y
+        # el resto (p. ej. '1s' o '2d', que algunos exchanges admiten) se descarga sin más
+        if tf not in _TF_MINUTES:
+            return self._fetch_ohlcv(symbol, tf, limit, None)
+        tf_ms = _TF_MINUTES[tf] * 60000
+        path = _OHLCV_DISK_DIR / self.exchange_id / f"{symbol.replace('/', '_').replace(':', '_')}_{tf}.npy"
+        try:
+            cached = np.load(path)
+        except (OSError, ValueError):
+            cached = None
+        
+        rows = None
+        if cached is not None and len(cached) >= limit:
+            # Desde la última vela guardada, incluida: pudo guardarse aún abierta
+            cap = _OHLCV_LIMITS.get(self.exchange_id, _OHLCV_DEFAULT_LIMIT)
+            new = self.ccxt_client.fetch_ohlcv(symbol, tf, limit=cap, since=int(cached[-1, 0]))
+            # Si llegan cap velas podría quedar un hueco hasta el presente: descarga completa
+            if new and len(new) < cap:
+                rows = _merge_ohlcv_rows((cached, new))
+                # Una página corta no garantiza que no falten velas (el límite real del
+                # exchange puede ser menor que cap): si la vela más reciente cerró antes
+                # de now - tf la caché se quedó atrás y se descarga todo de nuevo
+                if rows[-1, 0] + tf_ms < time.time() * 1000 - tf_ms:
+                    rows = None
+        
+        if rows is None:
+            rows = self._fetch_ohlcv(symbol, tf, limit, None)
+            if len(rows) == 0:
+                return rows
+        
+        _save_ohlcv_rows(path, rows[-_OHLCV_DISK_MAX_ROWS:], symbol)
+        return rows[-limit:]
+    
+    def _fetch_ohlcv_history(self, symbol, tf, limit, since):
+        """Velas desde since, guardadas en disco (ver _OHLCV_HISTORY_TTL)"""
+        key = hashlib.blake2b(f"{self.exchange_id}:{symbol}:{tf}:{since}:{limit}".encode(), digest_size=8).hexdigest()
+        path = _OHLCV_DISK_DIR / 'history' / f'{key}.npy'
+        tf_seconds = self.ccxt_client.parse_timeframe(tf)
+        try:
+            mtime = path.stat().st_mtime
+            rows = np.load(path)
+            # Ventana completa y ya cerrada al guardarse: histórico inmutable, no caduca
+            # (se renueva el mtime para que la expulsión descarte antes las no usadas)
+            if len(rows) == limit and rows[-1, 0] / 1000 + tf_seconds <= mtime:
+                os.utime(path)
+                return rows
+            # Ventana que llega a la vela en formación o al presente: solo un rato
+            if time.time() - mtime < _OHLCV_HISTORY_TTL:
+                return rows
+        except (OSError, ValueError):
+            pass
+        
+        rows = self._fetch_ohlcv(symbol, tf, limit, since)
+        if len(rows) == 0:
+            return rows
+        
+        _save_ohlcv_rows(path, rows, symbol)
+        _evict_ohlcv_history(path.parent)
+        return rows
+    
+    def get_ohlcv_batch(self, symbols, timeframe='1h', limit=100):
+        """
+        Obtener datos OHLCV de varios símbolos en paralelo con hilos
+        
+        Versión síncrona de get_ohlcv_many para código que no corre en un event loop:
+        las esperas de red se solapan y enableRateLimit sigue espaciando las peticiones.
+        
+        Returns:
+            dict: {símbolo: DataFrame}
+        """
+        symbols = list(dict.fromkeys(symbols))  # Sin repetidos, mismo orden
+        if not symbols:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(8, len(symbols))) as pool:
+            results = pool.map(lambda symbol: self.get_ohlcv_data(symbol, timeframe, limit), symbols)
+            return dict(zip(symbols, results))
+    
+    def _ohlcv_pages(self, client, tf, limit, since):
+        """
+        Paginación de fetch_ohlcv, común a las versiones síncrona y asíncrona
+        
+        Generador que produce (since, limit) de cada llamada, recibe con send() las
+        filas devueltas y termina devolviendo las velas combinadas (array ordenado y
+        sin repetidos). Una página corta no indica el final de los datos: el límite
+        real de un exchange puede ser menor que el de _OHLCV_LIMITS.
+        """
+        cap = _OHLCV_LIMITS.get(self.exchange_id, _OHLCV_DEFAULT_LIMIT)
+        tf_ms = client.parse_timeframe(tf) * 1000
+        pages = []
+        count = 0
+        
+        if since is None:
+            # Últimas limit velas: primero las más recientes y después hacia atrás desde
+            # la más antigua recibida, en pasos del tamaño de página observado
+            page = yield None, min(cap, limit)
+            page_size = len(page)
+            while page:
+                pages.append(page)
+                count += len(page)
+                if count >= limit:
+                    break
+                oldest = min(row[0] for row in pages[-1])
+                step = min(page_size, limit - count)
+                page = yield oldest - step * tf_ms, step
+                page = [row for row in page if row[0] < oldest]  # vacío: inicio del histórico
+                page_size = max(page_size, len(page))
+            return _merge_ohlcv_rows(pages)[-limit:]
+        
+        # Desde since hacia delante hasta reunir limit velas o alcanzar el presente
+        now_ms = time.time() * 1000
+        while count < limit and since <= now_ms:
+            page = yield since, min(cap, limit - count)
+            page = [row for row in page if row[0] >= since]
+            if not page:
+                break  # No hay más velas disponibles
+            pages.append(page)
+            count += len(page)
+            since = max(row[0] for row in page) + tf_ms
+        return _merge_ohlcv_rows(pages)[:limit]
+    
+    def _build_candles(self, ohlcv, cache_key, symbol, timeframe, limit):
+        """Convertir la respuesta OHLCV de CCXT en Candles y guardarla en la caché"""
+        # Verificar si se obtuvieron datos
+        if ohlcv is None or len(ohlcv) == 0:
+            logger.warning("No se obtuvieron datos para %s en %s", symbol, self.exchange_id)
+            return self.generate_mock_candles(symbol, timeframe, limit)
+        
+        # Convertir a un array NumPy contiguo y separarlo por columnas
+        # (evita que pandas recorra la lista de listas celda a celda)
+        arr = _ohlcv_array(ohlcv)
+        
+        # Trasponer en una sola copia: cols es (6, n) en orden C, así cada columna OHLCV
+        # queda contigua en memoria. CCXT devuelve las velas en orden ascendente; solo se
+        # ordena (O(n log n)) si la comprobación O(n) detecta lo contrario
+        ts = arr[:, 0]
+        if (ts[1:] >= ts[:-1]).all():
+            cols = np.ascontiguousarray(arr.T)
+        else:
+            cols = arr.T[:, np.argsort(ts, kind='stable')]
+        
+        values = cols[1:].astype(_OHLCV_DTYPE, copy=False)
+        candles = Candles(
+            timestamp=cols[0].astype(np.int64).astype('datetime64[ms]').astype('datetime64[ns]'),
+            open=values[0],
+            high=values[1],
+            low=values[2],
+            close=values[3],
+            volume=values[4]
+        )
+        # Con since explícito y la ventana completa la respuesta ya no depende del presente
+        fixed_window = cache_key[4] is not None and cols.shape[1] >= limit
+        _ohlcv_cache_put(cache_key, candles, self._candles_ttl(cols[0, -1], timeframe, fixed_window))
+        
+        return candles
+    
+    def _candles_ttl(self, last_timestamp_ms, timeframe, fixed_window=False):
+        """Segundos que pueden cachearse unas velas cuya última vela abrió en last_timestamp_ms"""
+        try:
+            tf_seconds = self.ccxt_client.parse_timeframe(self._timeframe_to_interval(timeframe))
+        except Exception:
+            return _OHLCV_CACHE_TTL
+        
+        # Si la última vela sigue abierta los datos cambian continuamente
+        last_close = last_timestamp_ms / 1000 + tf_seconds
+        now = time.time()
+        if last_close > now:
+            return _OHLCV_CACHE_TTL
+        # Una ventana histórica completa y cerrada no cambia durante todo un timeframe
+        if fixed_window:
+            return tf_seconds
+        # Las "últimas N" de un exchange que omite la vela en formación cambian cuando
+        # cierra la vela siguiente (last_open + 2*tf): caducan entonces y nunca antes
+        # del TTL corto si el exchange va con retraso
+        return max(last_close + tf_seconds - now, _OHLCV_CACHE_TTL)
     
     def generate_mock_data(self, symbol, timeframe='1h', limit=100):
         """Generar datos simulados para pruebas y fallback"""
-        # Mapeo de timeframe a minutos para simulación
-        timeframe_minutes = {
-            '1m': 1, '5m': 5, '15m': 15, '30m': 30,
-            '1h': 60, '2h': 120, '4h': 240, '6h': 360, '8h': 480, '12h': 720,
-            '1d': 1440, '3d': 4320, '1w': 10080, '1M': 43200
-        }
-        
-        minutes = timeframe_minutes.get(self._timeframe_to_interval(timeframe), 60)
+        return self.generate_mock_candles(symbol, timeframe, limit).to_df()
+    
+    def generate_mock_candles(self, symbol, timeframe='1h', limit=100):
+        """Generar datos simulados como arrays NumPy (Candles)"""
+        minutes = _TF_MINUTES.get(self._timeframe_to_interval(timeframe), 60)
         end_time = datetime.now()
         
-        # Generar timestamps
-        times = [end_time - timedelta(minutes=minutes * i) for i in range(limit)]
-        times.reverse()
+        # Generar timestamps (orden ascendente) con aritmética datetime64 de NumPy: una sola
+        # operación vectorizada, sin objetos timedelta. La última vela se alinea al inicio
+        # de su intervalo, igual que las velas reales del exchange
+        offsets = np.arange(limit - 1, -1, -1)
+        if minutes == _TF_MINUTES['1M']:
+            # Velas mensuales: inicio de cada mes natural (los meses no tienen ancho fijo)
+            times = (np.datetime64(end_time, 'M') - offsets).astype('datetime64[ns]')
+        else:
+            # Intervalos de ancho fijo contados desde el epoch; las semanas empiezan en
+            # lunes como en los exchanges (el 1970-01-01 fue jueves)
+            origin = np.datetime64('1970-01-05', 'm') if minutes == _TF_MINUTES['1w'] else np.datetime64(0, 'm')
+            step = np.timedelta64(minutes, 'm')
+            end = np.datetime64(end_time, 'm')
+            end -= (end - origin) % step
+            times = (end - step * offsets).astype('datetime64[ns]')
         
         # Base inicial basada en el activo
         base_asset = symbol.split('/')[0] if '/' in symbol else 'UNKNOWN'
         
-        if base_asset == 'BTC':
-            base_price = 65000
-            volatility = 1200
-        elif base_asset == 'ETH':
-            base_price = 3200
-            volatility = 180
-        elif base_asset == 'BNB':
-            base_price = 570
-            volatility = 15
-        elif base_asset == 'SOL':
-            base_price = 146
-            volatility = 8
-        elif base_asset == 'XRP':
-            base_price = 0.50
-            volatility = 0.03
-        elif base_asset == 'ADA':
-            base_price = 0.45
-            volatility = 0.025
-        else:
-            base_price = 100
-            volatility = 5
+        base_price, volatility = _MOCK_PRICES.get(base_asset, _MOCK_DEFAULT_PRICE)
             
         # Generar precios simulando una tendencia realista
-        np.random.seed(int(time.time()) % 100)  # Usar tiempo actual para seed diferente cada vez
-        price_changes = np.random.randn(limit) * (volatility * 0.01)
-        # Añadir un pequeño componente de tendencia
-        trend = np.linspace(-0.01, 0.01, limit) * base_price
-        price_changes = price_changes + trend
+        # Un único generador local y una sola extracción para las cuatro series de ruido
+        rng = np.random.default_rng(time.time_ns() & 0xFFFF)  # Usar tiempo actual para seed diferente cada vez
+        z = rng.standard_normal((4, limit), dtype=_OHLCV_DTYPE)
+        
+        # Todas las series se calculan en un único bloque preasignado con operaciones
+        # in-place (out=), sin arrays temporales intermedios; cada fila es una columna
+        ohlcv = np.empty((5, limit), dtype=_OHLCV_DTYPE)
+        open_prices, high_prices, low_prices, close_prices, volumes = ohlcv
+        
+        # Las variaciones de precio usan la fila de volumen como búfer hasta el final
+        price_changes = volumes
+        np.multiply(z[0], volatility * 0.01, out=price_changes)
+        # Añadir un pequeño componente de tendencia lineal de -1% a +1% del precio base
+        # (una sola rampa arange escalada in-place en vez de los temporales de linspace)
+        trend = np.arange(limit, dtype=_OHLCV_DTYPE)
+        trend *= 0.02 * base_price / max(limit - 1, 1)
+        trend -= 0.01 * base_price
+        price_changes += trend
         
-        close_prices = base_price + np.cumsum(price_changes)
-        open_prices = close_prices - np.random.randn(limit) * (volatility * 0.005)
-        high_prices = np.maximum(close_prices, open_prices) + np.abs(np.random.randn(limit) * (volatility * 0.008))
-        low_prices = np.minimum(close_prices, open_prices) - np.abs(np.random.randn(limit) * (volatility * 0.008))
+        np.cumsum(price_changes, out=close_prices)
+        close_prices += base_price
+        np.multiply(z[1], volatility * 0.005, out=open_prices)
+        np.subtract(close_prices, open_prices, out=open_prices)
+        
+        noise = np.abs(z[2:], out=z[2:])
+        noise *= volatility * 0.008
+        np.maximum(close_prices, open_prices, out=high_prices)
+        high_prices += noise[0]
+        np.minimum(close_prices, open_prices, out=low_prices)
+        low_prices -= noise[1]
         
         # Generar volumen realista correlacionado con la volatilidad
         base_volume = base_price * 10  # Mayor precio, mayor volumen base
-        volatility_factor = np.abs(price_changes) / np.mean(np.abs(price_changes))
-        volumes = base_volume * (0.5 + volatility_factor)
-        
-        # Crear DataFrame
-        df = pd.DataFrame({
-            'timestamp': times,
-            'open': open_prices,
-            'high': high_prices,
-            'low': low_prices,
-            'close': close_prices,
-            'volume': volumes
-        })
+        np.abs(price_changes, out=price_changes)
+        price_changes /= price_changes.mean()
+        price_changes += 0.5
+        price_changes *= base_volume
         
-        print(f"Generando datos simulados para {symbol} - {timeframe}")
-        return df
+        logger.debug("Generando datos simulados para %s - %s", symbol, timeframe)
+        return Candles(
+            timestamp=times,
+            open=open_prices,
+            high=high_prices,
+            low=low_prices,
+            close=close_prices,
+            volume=volumes
+        )
     
     def get_available_exchanges(self):
         """Obtener lista de exchanges disponibles en CCXT"""
         # Devolver los exchanges más populares primero, luego el resto
-        popular_exchanges = ['binance', 'bybit', 'kucoin', 'okx', 'coinbase', 'kraken', 'bitget', 'mexc']
-        other_exchanges = [ex for ex in ccxt.exchanges if ex not in popular_exchanges]
-        return popular_exchanges + other_exchanges
+        return list(_available_exchanges())
     
     def get_available_pairs(self, exchange=None):
         """Obtener pares disponibles para el exchange actual o uno específico"""
         try:
-            # Si se especifica un exchange diferente, creamos un cliente temporal
-            if exchange and exchange != self.exchange_id:
-                temp_client = MarketDataClient(exchange_id=exchange)
-                return temp_client.get_available_pairs()
+            # Devolver los pares cacheados si siguen vigentes
+            # (mismo formato de id que MarketDataClient para que la clave coincida)
+            exchange_id = str(exchange).lower() if exchange else self.exchange_id
+            cached = _PAIRS_CACHE.get(exchange_id)
+            if cached and time.monotonic() - cached[0] < _PAIRS_CACHE_TTL:
+                return list(cached[1])
+            
+            # Para un exchange diferente basta con un cliente público compartido:
+            # solo se necesitan los mercados, no credenciales ni un MarketDataClient
+            if exchange_id != self.exchange_id:
+                client = _public_ccxt_client(exchange_id)
+            else:
+                client = self.ccxt_client
             
-            # Usamos el cliente actual
-            if self.ccxt_client:
+            if client:
                 # Cargar mercados si no están cargados
-                if not hasattr(self.ccxt_client, 'markets') or not self.ccxt_client.markets:
-                    self.ccxt_client.load_markets()
+                if not hasattr(client, 'markets') or not client.markets:
+                    _load_markets_cached(client, exchange_id)
                 
                 # Filtrar solo pares activos con USDT, BUSD o USDC
-                pairs = []
-                for symbol, market in self.ccxt_client.markets.items():
-                    if market['active'] and ('/USDT' in symbol or '/BUSD' in symbol or '/USDC' in symbol):
-                        pairs.append(symbol)
+                pairs = [
+                    symbol for symbol, market in client.markets.items()
+                    if market.get('active') and market.get('quote') in _PAIR_QUOTES
+                ]
                 
                 if pairs:
-                    return sorted(pairs)
+                    pairs.sort()
+                    _PAIRS_CACHE[exchange_id] = (time.monotonic(), tuple(pairs))
+                    return pairs
             
             # Fallback a pares predeterminados
             return self._get_default_pairs()
                 
         except Exception as e:
-            print(f"Error al obtener pares para {self.exchange_id}: {str(e)}")
+            logger.error("Error al obtener pares para %s: %s", self.exchange_id, e)
             return self._get_default_pairs()
     
+    def get_available_pairs_multi(self, exchanges):
+        """
+        Obtener los pares de varios exchanges en paralelo
+        
+        load_markets es E/S pura (el GIL se libera durante la espera de red), así que
+        con un hilo por exchange el tiempo total es el del más lento y no la suma.
+        
+        Args:
+            exchanges (list): IDs de los exchanges
+            
+        Returns:
+            dict: {exchange: lista de pares}
+        """
+        exchanges = list(dict.fromkeys(exchanges))  # Sin repetidos, mismo orden
+        if not exchanges:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(8, len(exchanges))) as pool:
+            return dict(zip(exchanges, pool.map(self.get_available_pairs, exchanges)))
+    
     def _get_default_pairs(self):
         """Lista predeterminada de pares comunes"""
-        return [
-            'BTC/USDT', 'ETH/USDT', 'BNB/USDT', 'SOL/USDT', 
-            'ADA/USDT', 'XRP/USDT', 'DOT/USDT', 'AVAX/USDT',
-            'DOGE/USDT', 'SHIB/USDT', 'MATIC/USDT', 'LTC/USDT'
-        ]
+        return list(_DEFAULT_PAIRS)
         
     # Método de compatibilidad con código antiguo
     def get_market_data(self, exchange, symbol, timeframe='1h', limit=100):
         """Obtener datos de mercado (compatibilidad con código antiguo)"""
-        # Si se especifica un exchange diferente del actual, crear un cliente temporal
-        if exchange != self.exchange_id:
-            temp_client = MarketDataClient(exchange_id=exchange)
-            return temp_client.get_ohlcv_data(symbol, timeframe, limit)
+        return self._client_for(exchange).get_ohlcv_data(symbol, timeframe, limit)
+    
+    def _client_for(self, exchange):
+        """Cliente para el exchange indicado: este mismo o el compartido del proceso"""
+        # Si es un exchange distinto del actual se usa el cliente público compartido,
+        # así varios MarketDataClient no construyen cada uno el suyo
+        if str(exchange).lower() == self.exchange_id:
+            return self
+        return get_market_data_client(exchange)
+    
+    # Variantes asíncronas basadas en ccxt.async_support: las peticiones no bloquean
+    # el event loop y varias pueden solaparse con asyncio.gather. Un cliente asíncrono
+    # (y su sesión aiohttp) solo funciona en el event loop en el que se creó, así que
+    # el MarketDataClient compartido guarda uno por loop.
+    def _get_async_client(self):
+        """Obtener (creándolo en el primer uso) el cliente ccxt.async_support del event loop actual"""
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None:
+            import ccxt.async_support as ccxt_async
+            
+            # Los clientes de loops ya cerrados no pueden usarse ni cerrarse: se descartan
+            for old_loop in [old for old in self._async_clients if old.is_closed()]:
+                del self._async_clients[old_loop]
+            
+            if not self.ccxt_client:
+                self._init_ccxt_client()
+            
+            # Mismas credenciales que el cliente síncrono (tras un posible fallback)
+            config = {
+                'apiKey': self.ccxt_client.apiKey,
+                'secret': self.ccxt_client.secret,
+                'enableRateLimit': True,
+                'timeout': 30000,
+            }
+            if self.ccxt_client.password:
+                config['password'] = self.ccxt_client.password
+            
+            client = self._async_clients[loop] = getattr(ccxt_async, self.exchange_id)(config)
+            _ASYNC_CLIENTS.add(self)
+        return client
+    
+    async def aget_ohlcv_data(self, symbol, timeframe='1h', limit=100, since=None, dtype_backend=None):
+        """Versión asíncrona de get_ohlcv_data"""
+        return (await self.aget_ohlcv_candles(symbol, timeframe, limit, since)).to_df(dtype_backend)
+    
+    async def aget_ohlcv_candles(self, symbol, timeframe='1h', limit=100, since=None):
+        """Versión asíncrona de get_ohlcv_candles"""
+        cache_key = (self.exchange_id, symbol, timeframe, limit, since)
+        candles = _ohlcv_cache_get(cache_key)
+        if candles is not None:
+            return candles
+        
+        try:
+            client = self._get_async_client()
+            
+            # Verificar si el exchange soporta OHLCV
+            if not client.has['fetchOHLCV']:
+                logger.warning("Exchange %s no soporta OHLCV", self.exchange_id)
+                return self.generate_mock_candles(symbol, timeframe, limit)
+            
+            tf = self._timeframe_to_interval(timeframe)
+            ohlcv = await self._afetch_ohlcv(client, symbol, tf, limit, since)
+            
+            return self._build_candles(ohlcv, cache_key, symbol, timeframe, limit)
+                
+        except Exception as e:
+            logger.error("Error al obtener datos de %s via CCXT: %s", self.exchange_id, e)
+            return self.generate_mock_candles(symbol, timeframe, limit)
+    
+    async def _afetch_ohlcv(self, client, symbol, tf, limit, since):
+        """Versión asíncrona de _fetch_ohlcv"""
+        pages = self._ohlcv_pages(client, tf, limit, since)
+        try:
+            page_since, page_limit = next(pages)
+            while True:
+                page = await client.fetch_ohlcv(symbol, tf, limit=page_limit, since=page_since)
+                page_since, page_limit = pages.send(page)
+        except StopIteration as stop:
+            return stop.value
+    
+    async def get_ohlcv_many(self, symbols, timeframe='1h', limit=100):
+        """
+        Obtener velas de varios símbolos del exchange actual de forma concurrente
+        
+        Returns:
+            dict: {símbolo: Candles}
+        """
+        # Las velas cacheadas se devuelven sin esperar; las descargas comparten el cliente
+        # asíncrono, cuyo enableRateLimit las encola y espacia según el límite del exchange
+        results = await asyncio.gather(
+            *[self.aget_ohlcv_candles(symbol, timeframe, limit) for symbol in symbols]
+        )
+        return dict(zip(symbols, results))
+    
+    async def aget_market_data(self, exchange, symbol, timeframe='1h', limit=100):
+        """Versión asíncrona de get_market_data"""
+        return await self._client_for(exchange).aget_ohlcv_data(symbol, timeframe, limit)
+    
+    async def gather_klines(self, specs):
+        """
+        Obtener varias series OHLCV de forma concurrente
         
-        # Usar el cliente actual
-        return self.get_ohlcv_data(symbol, timeframe, limit)
+        Args:
+            specs (list): Tuplas (exchange, symbol, timeframe, limit)
+            
+        Returns:
+            list: DataFrames en el mismo orden que specs
+        """
+        return await asyncio.gather(*[self.aget_market_data(*spec) for spec in specs])
+    
+    async def aclose(self):
+        """Cerrar la sesión HTTP del cliente asíncrono del event loop actual, si se llegó a crear"""
+        client = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if not self._async_clients:
+            _ASYNC_CLIENTS.discard(self)
+        if client is not None:
+            await client.close()
 
 
 # Funciones auxiliares para uso directo sin necesidad de instanciar la clase
+def get_market_data_client(exchange_id="binance"):
+    """
+    Obtiene un MarketDataClient compartido para el exchange indicado
+    
+    El cliente CCXT y sus mercados cargados se reutilizan entre peticiones en
+    lugar de reconstruirse (y volver a llamar a load_markets) en cada una.
+    Solo para clientes públicos: con API keys propias instanciar MarketDataClient.
+    """
+    # El id suele llegar de la petición: se normaliza y los que CCXT no soporta se
+    # resuelven a Binance (el mismo fallback que MarketDataClient), de modo que la
+    # caché solo guarda ids válidos y no una entrada por cada variante recibida
+    exchange_id = str(exchange_id).lower()
+    if exchange_id not in _ccxt_exchanges():
+        logger.warning("Exchange %s no soportado por CCXT, se usa binance", exchange_id)
+        exchange_id = "binance"
+    return _shared_market_data_client(exchange_id)
+
+@functools.lru_cache(maxsize=32)
+def _shared_market_data_client(exchange_id):
+    """MarketDataClient público por exchange, creado una vez por proceso"""
+    return MarketDataClient(exchange_id=exchange_id)
+
+async def aclose_all():
+    """Cerrar las sesiones de todos los clientes asíncronos abiertos (p. ej. al apagar la API)"""
+    for client in list(_ASYNC_CLIENTS):
+        await client.aclose()
+
 def get_ohlcv_data(exchange="binance", symbol="BTC/USDT", timeframe="1h", limit=100, since=None):
     """
     Obtiene datos OHLCV para un símbolo y timeframe específicos
@@ -321,5 +986,5 @@ def get_ohlcv_data(exchange="binance", symbol="BTC/USDT", timeframe="1h", limit=
     Returns:
         DataFrame: Datos OHLCV con columnas [timestamp, open, high, low, close, volume]
     """
-    client = MarketDataClient(exchange)
+    client = get_market_data_client(exchange)
     return client.get_ohlcv_data(symbol, timeframe, limit, since)
@@ -130,3 +130,39 @@ def test_me_endpoint(test_db):
     # Verificar: Comprobar que se obtiene la información correcta
     assert response.status_code == 200
     assert response.json()["email"] == "test@example.com"
+
+def test_register_invalid_body(test_db):
+    """Test para verificar que un cuerpo inválido devuelve 422 localizado en body"""
+    # Ejecutar: Registrar con un email no válido y sin contraseña
+    response = client.post(
+        "/api/v1/auth/register",
+        json={"email": "no-es-un-email", "full_name": "New User"}
+    )
+    
+    # Verificar: Comprobar que la validación falla sobre el cuerpo
+    assert response.status_code == 422
+    errors = response.json()["detail"]
+    assert errors
+    assert all(error["loc"][0] == "body" for error in errors)
+    assert {error["loc"][1] for error in errors} == {"email", "password"}
+
+def test_register_invalid_json(test_db):
+    """Test para verificar que un JSON mal formado devuelve 422"""
+    response = client.post(
+        "/api/v1/auth/register",
+        content=b"{no json",
+        headers={"Content-Type": "application/json"}
+    )
+    
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"][0] == "body"
+
+def test_register_openapi_request_body():
+    """Test para verificar que el esquema del cuerpo de /register aparece en OpenAPI"""
+    response = client.get(app.openapi_url)
+    
+    assert response.status_code == 200
+    request_body = response.json()["paths"]["/api/v1/auth/register"]["post"]["requestBody"]
+    assert request_body["required"] is True
+    schema = request_body["content"]["application/json"]["schema"]
+    assert {"email", "password"} <= set(schema["properties"])
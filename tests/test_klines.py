@@ -0,0 +1,99 @@
+import importlib.util
+from pathlib import Path
+
+import numpy as np
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.utils.market_data import Candles
+
+# El router vive en api/app, cuyo paquete se llama igual que el de la aplicación
+# principal: se carga desde su ruta (app.utils.market_data es el mismo módulo en ambos)
+KLINES_PATH = Path(__file__).resolve().parents[1] / "api" / "app" / "routers" / "klines.py"
+spec = importlib.util.spec_from_file_location("api_klines", KLINES_PATH)
+klines = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(klines)
+
+api = FastAPI()
+api.include_router(klines.router, prefix="/api/v1")
+client = TestClient(api)
+
+class StubClient:
+    """Cliente de mercado que devuelve siempre las mismas velas"""
+    def __init__(self, candles):
+        self.candles = candles
+        self.calls = 0
+
+    async def aget_ohlcv_candles(self, symbol, timeframe="1h", limit=100, since=None):
+        self.calls += 1
+        return self.candles
+
+def make_candles(closes, dtype=np.float64):
+    """Helper para crear velas horarias con los cierres indicados"""
+    n = len(closes)
+    times = np.datetime64("2024-01-01T00:00", "ns") + np.arange(n) * np.timedelta64(1, "h")
+    close = np.asarray(closes, dtype=dtype)
+    return Candles(timestamp=times, open=close, high=close + 1, low=close - 1, close=close,
+                   volume=np.ones(n, dtype=dtype))
+
+@pytest.fixture
+def stub_client(monkeypatch):
+    stub = StubClient(make_candles([100.0, 101.0, 102.0]))
+    monkeypatch.setattr(klines, "get_market_data_client", lambda exchange: stub)
+    return stub
+
+def test_klines_etag(stub_client):
+    """Test para verificar que /klines devuelve las velas con un ETag"""
+    response = client.get("/api/v1/klines", params={"symbol": "BTC/USDT", "limit": 3})
+
+    assert response.status_code == 200
+    assert response.headers["etag"].startswith('W/"')
+    data = response.json()["data"]
+    assert [candle["close"] for candle in data] == [100.0, 101.0, 102.0]
+    assert data[0]["time"] == 1704067200000
+
+def test_klines_not_modified(stub_client):
+    """Test para verificar que un If-None-Match vigente devuelve 304 sin cuerpo"""
+    etag = client.get("/api/v1/klines", params={"symbol": "BTC/USDT"}).headers["etag"]
+
+    response = client.get(
+        "/api/v1/klines",
+        params={"symbol": "BTC/USDT"},
+        headers={"If-None-Match": etag}
+    )
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+def test_klines_etag_changes_with_data(stub_client):
+    """Test para verificar que el ETag cambia cuando cambian las velas"""
+    etag = client.get("/api/v1/klines", params={"symbol": "BTC/USDT"}).headers["etag"]
+    stub_client.candles = make_candles([100.0, 101.0, 103.0])
+
+    response = client.get(
+        "/api/v1/klines",
+        params={"symbol": "BTC/USDT"},
+        headers={"If-None-Match": etag}
+    )
+
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+
+def test_klines_json_response(stub_client):
+    """Test para verificar que /klines responde JSON serializado con orjson"""
+    response = client.get("/api/v1/klines", params={"symbol": "BTC/USDT"})
+
+    assert response.headers["content-type"] == "application/json"
+    assert response.json()["symbol"] == "BTC/USDT"
+    assert len(response.json()["data"]) == 3
+
+def test_klines_float32_candles(stub_client):
+    """Test para verificar que /klines serializa velas float32 como números JSON"""
+    stub_client.candles = make_candles([100.1, 101.2], dtype=np.float32)
+
+    data = client.get("/api/v1/klines", params={"symbol": "BTC/USDT"}).json()["data"]
+
+    assert [candle["close"] for candle in data] == [float(np.float32(100.1)), float(np.float32(101.2))]
+    assert data[1]["time"] - data[0]["time"] == 3600 * 1000
@@ -0,0 +1,96 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.main import app
+from app.db.session import Base
+from app.core.deps import get_db, get_current_active_user
+from app.models.user import User
+from app.models.exchange import Exchange
+from app.models.strategy import Strategy, Trade
+
+# Base de datos de prueba (misma configuración que test_auth)
+SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
+engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+def override_get_db():
+    db = TestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+client = TestClient(app)
+
+@pytest.fixture
+def user_with_data():
+    """Usuario autenticado con un exchange, una estrategia y un trade"""
+    Base.metadata.create_all(bind=engine)
+    db = TestingSessionLocal()
+    user = User(email="lists@example.com", hashed_password="x", full_name="List User",
+                is_active=True, user_level="basic")
+    db.add(user)
+    db.commit()
+    exchange = Exchange(user_id=user.id, name="Mi Binance", exchange_type="binance",
+                        api_key="key", api_secret="secret", config={"testnet": True})
+    db.add(exchange)
+    db.commit()
+    strategy = Strategy(user_id=user.id, name="Cruce de medias", exchange_id=exchange.id,
+                        symbol="BTC/USDT", timeframe="1h", params={"fast": 9})
+    db.add(strategy)
+    db.commit()
+    db.add(Trade(strategy_id=strategy.id, symbol="BTC/USDT", order_type="market",
+                 side="buy", price=65000.0, amount=0.1))
+    db.commit()
+    db.refresh(user)
+    db.refresh(strategy)
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_current_active_user] = lambda: user
+    try:
+        yield user, strategy.id
+    finally:
+        app.dependency_overrides.pop(get_current_active_user, None)
+        db.close()
+        Base.metadata.drop_all(bind=engine)
+
+def test_read_exchanges_json(user_with_data):
+    """Test para verificar la forma del JSON del listado de exchanges"""
+    response = client.get("/api/v1/exchanges/")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    [exchange] = response.json()
+    assert exchange["name"] == "Mi Binance"
+    assert exchange["exchange_type"] == "binance"
+    assert exchange["config"] == {"testnet": True}
+    assert {"id", "user_id", "is_active", "created_at", "updated_at"} <= set(exchange)
+
+def test_read_strategies_and_trades_json(user_with_data):
+    """Test para verificar la forma del JSON de los listados de estrategias y trades"""
+    _, strategy_id = user_with_data
+
+    [strategy] = client.get("/api/v1/strategies/").json()
+    assert strategy["id"] == strategy_id
+    assert strategy["params"] == {"fast": 9}
+    assert strategy["timeframe"] == "1h"
+
+    [trade] = client.get(f"/api/v1/strategies/{strategy_id}/trades").json()
+    assert trade["strategy_id"] == strategy_id
+    assert trade["side"] == "buy"
+    assert trade["price"] == 65000.0
+
+def test_list_endpoints_openapi_schema():
+    """Test para verificar que OpenAPI describe los listados como arrays del esquema de respuesta"""
+    paths = client.get(app.openapi_url).json()["paths"]
+
+    for path, model in [
+        ("/api/v1/exchanges/", "Exchange"),
+        ("/api/v1/strategies/", "Strategy"),
+        ("/api/v1/strategies/{strategy_id}/trades", "Trade"),
+    ]:
+        schema = paths[path]["get"]["responses"]["200"]["content"]["application/json"]["schema"]
+        assert schema["type"] == "array"
+        assert schema["items"]["$ref"] == f"#/components/schemas/{model}"
@@ -0,0 +1,570 @@
+import asyncio
+import os
+import time
+
+import numpy as np
+import pytest
+
+from app.utils import market_data
+from app.utils.market_data import MarketDataClient, get_market_data_client
+
+
+@pytest.fixture(autouse=True)
+def clean_caches(tmp_path, monkeypatch):
+    """Cachés en memoria vacías y cachés en disco redirigidas a un directorio temporal"""
+    monkeypatch.setattr(market_data, "_OHLCV_DISK_DIR", tmp_path / "ohlcv")
+    monkeypatch.setattr(market_data, "_MARKETS_CACHE_DIR", tmp_path / "markets")
+    market_data._OHLCV_CACHE.clear()
+    yield
+    market_data._OHLCV_CACHE.clear()
+
+def test_shared_client_normalizes_exchange_id():
+    """Test para verificar que las variantes de un id comparten el mismo cliente"""
+    client = get_market_data_client("binance")
+
+    assert get_market_data_client("BINANCE") is client
+    assert client.exchange_id == "binance"
+
+def test_shared_client_unknown_exchange_falls_back_to_binance():
+    """Test para verificar que un id no soportado no crea entradas nuevas en la caché"""
+    binance = get_market_data_client("binance")
+    size = market_data._shared_market_data_client.cache_info().currsize
+
+    for i in range(50):
+        assert get_market_data_client(f"no-existe-{i}") is binance
+
+    assert market_data._shared_market_data_client.cache_info().currsize == size
+
+def test_client_for_uses_shared_clients():
+    """Test para verificar que _client_for no guarda clientes por instancia"""
+    client = MarketDataClient("binance")
+
+    assert client._client_for("Binance") is client
+    assert client._client_for("kraken") is get_market_data_client("kraken")
+    assert not hasattr(client, "__dict__")
+
+def test_get_market_data_dispatch(monkeypatch):
+    """Test para verificar que get_market_data despacha al cliente del exchange pedido"""
+    other = get_market_data_client("kraken")
+    calls = []
+    monkeypatch.setattr(MarketDataClient, "get_ohlcv_data",
+                        lambda self, symbol, timeframe, limit: calls.append((self, symbol)))
+    client = MarketDataClient("binance")
+
+    client.get_market_data("binance", "BTC/USDT")
+    client.get_market_data("kraken", "ETH/USDT")
+
+    assert calls == [(client, "BTC/USDT"), (other, "ETH/USDT")]
+
+def test_client_for_after_fallback():
+    """Test para verificar que tras el fallback a Binance las peticiones de binance usan el propio cliente"""
+    client = MarketDataClient("no-existe")
+
+    assert client.exchange_id == "binance"
+    assert client._client_for("binance") is client
+
+def test_candles_ttl():
+    """Test para verificar la vigencia de las velas según el estado de la última vela"""
+    client = MarketDataClient("binance")
+    hour_ms = 3600 * 1000
+    now_ms = time.time() * 1000
+    current_open = now_ms - now_ms % hour_ms
+
+    # Última vela aún abierta: TTL corto
+    assert client._candles_ttl(current_open, "1h") == market_data._OHLCV_CACHE_TTL
+    # Última vela cerrada sin la vela en formación: caduca al cerrar la siguiente
+    ttl = client._candles_ttl(current_open - hour_ms, "1h")
+    assert ttl == pytest.approx((current_open + hour_ms - now_ms) / 1000, abs=1)
+    assert ttl <= 3600
+    # Ventana histórica completa: un timeframe entero
+    assert client._candles_ttl(current_open - 10 * hour_ms, "1h", fixed_window=True) == 3600
+    # Datos atrasados respecto al presente: nunca por debajo del TTL corto
+    assert client._candles_ttl(current_open - 10 * hour_ms, "1h") == market_data._OHLCV_CACHE_TTL
+
+def test_ohlcv_cache_lru_and_ttl(monkeypatch):
+    """Test para verificar la expulsión LRU y la caducidad de la caché de velas"""
+    monkeypatch.setattr(market_data, "_OHLCV_CACHE_MAXSIZE", 2)
+    candles = MarketDataClient("binance").generate_mock_candles("BTC/USDT", "1h", 5)
+
+    market_data._ohlcv_cache_put("a", candles, 60)
+    market_data._ohlcv_cache_put("b", candles, 60)
+    assert market_data._ohlcv_cache_get("a") is candles  # "a" pasa a ser la más reciente
+    market_data._ohlcv_cache_put("c", candles, 60)
+
+    assert market_data._ohlcv_cache_get("b") is None
+    assert market_data._ohlcv_cache_get("a") is candles
+    assert market_data._ohlcv_cache_get("c") is candles
+    assert not candles.close.flags.writeable
+
+    market_data._ohlcv_cache_put("d", candles, 0)
+    assert market_data._ohlcv_cache_get("d") is None
+    assert "d" not in market_data._OHLCV_CACHE
+
+HOUR_MS = 3600 * 1000
+
+class StubExchange:
+    """Exchange CCXT simulado: velas horarias continuas hasta la vela en formación"""
+    has = {"fetchOHLCV": True}
+    markets = {"BTC/USDT": {}}
+
+    def __init__(self, max_limit, history=5000, include_forming=True):
+        self.max_limit = max_limit
+        now_ms = int(time.time() * 1000)
+        last = now_ms - now_ms % HOUR_MS
+        if not include_forming:
+            last -= HOUR_MS
+        self.times = [last - i * HOUR_MS for i in range(history - 1, -1, -1)]
+        self.calls = []
+
+    def parse_timeframe(self, timeframe):
+        return 3600
+
+    def fetch_ohlcv(self, symbol, timeframe, limit=None, since=None):
+        self.calls.append((since, limit))
+        limit = min(limit or self.max_limit, self.max_limit)
+        if since is None:
+            times = self.times[-limit:]
+        else:
+            times = [t for t in self.times if t >= since][:limit]
+        return [[t, 1.0, 2.0, 0.5, 1.5, 10.0] for t in times]
+
+class AsyncStubExchange(StubExchange):
+    async def fetch_ohlcv(self, symbol, timeframe, limit=None, since=None):
+        return StubExchange.fetch_ohlcv(self, symbol, timeframe, limit, since)
+
+class LoopBoundExchange(AsyncStubExchange):
+    """Cliente ccxt.async_support simulado que, como aiohttp, solo funciona en el loop donde se creó"""
+    created = []
+
+    def __init__(self, config):
+        super().__init__(max_limit=300, history=100)
+        self.loop = asyncio.get_running_loop()
+        self.closed = False
+        self.created.append(self)
+
+    async def fetch_ohlcv(self, symbol, timeframe, limit=None, since=None):
+        assert asyncio.get_running_loop() is self.loop, "cliente usado desde otro event loop"
+        return await super().fetch_ohlcv(symbol, timeframe, limit, since)
+
+    async def close(self):
+        self.closed = True
+
+def stub_client(exchange_id, exchange):
+    client = MarketDataClient(exchange_id)
+    client.ccxt_client = exchange
+    return client
+
+def assert_latest(rows, exchange, limit):
+    """Las filas son las últimas limit velas del exchange, ordenadas y sin repetidos"""
+    assert rows[:, 0].tolist() == exchange.times[-limit:]
+
+def test_fetch_ohlcv_latest_with_smaller_real_limit():
+    """Test para verificar que sin since se pagina hacia atrás aunque el exchange devuelva menos que el límite supuesto"""
+    # kraken no está en _OHLCV_LIMITS (500 por defecto) y el exchange solo devuelve 300
+    exchange = StubExchange(max_limit=300)
+    client = stub_client("kraken", exchange)
+
+    rows = client._fetch_ohlcv("BTC/USDT", "1h", 1000, None)
+
+    assert_latest(rows, exchange, 1000)
+    assert exchange.calls[0] == (None, 500)
+
+def test_fetch_ohlcv_latest_with_table_limit():
+    """Test para verificar la paginación hacia atrás con el límite de _OHLCV_LIMITS (binance: 1000)"""
+    exchange = StubExchange(max_limit=1000, include_forming=False)
+    client = stub_client("binance", exchange)
+
+    rows = client._fetch_ohlcv("BTC/USDT", "1h", 2500, None)
+
+    assert_latest(rows, exchange, 2500)
+    assert len(exchange.calls) == 3
+
+def test_fetch_ohlcv_single_call_within_limit():
+    """Test para verificar que una petición dentro del límite hace una sola llamada"""
+    exchange = StubExchange(max_limit=1000)
+    client = stub_client("binance", exchange)
+
+    rows = client._fetch_ohlcv("BTC/USDT", "1h", 100, None)
+
+    assert_latest(rows, exchange, 100)
+    assert exchange.calls == [(None, 100)]
+
+def test_fetch_ohlcv_latest_stops_at_history_start():
+    """Test para verificar que la paginación hacia atrás termina al inicio del histórico"""
+    exchange = StubExchange(max_limit=300, history=700)
+    client = stub_client("kraken", exchange)
+
+    rows = client._fetch_ohlcv("BTC/USDT", "1h", 1000, None)
+
+    assert rows[:, 0].tolist() == exchange.times
+
+def test_fetch_ohlcv_since_short_pages():
+    """Test para verificar que con since una página corta no se toma como final de los datos"""
+    exchange = StubExchange(max_limit=300)
+    client = stub_client("kraken", exchange)
+    since = exchange.times[-801]
+
+    rows = client._fetch_ohlcv("BTC/USDT", "1h", 1000, since)
+
+    assert rows[:, 0].tolist() == exchange.times[-801:]
+
+def test_fetch_ohlcv_since_limit():
+    """Test para verificar que con since se devuelven exactamente limit velas desde since"""
+    exchange = StubExchange(max_limit=1000)
+    client = stub_client("binance", exchange)
+    since = exchange.times[1000]
+
+    rows = client._fetch_ohlcv("BTC/USDT", "1h", 1500, since)
+
+    assert rows[:, 0].tolist() == exchange.times[1000:2500]
+
+def test_merge_ohlcv_rows():
+    """Test para verificar que las páginas combinadas quedan ordenadas y sin repetidos"""
+    pages = [
+        [[3, 0, 0, 0, 3.0, 0], [4, 0, 0, 0, 4.0, 0]],
+        [[1, 0, 0, 0, 1.0, 0], [2, 0, 0, 0, 2.0, 0], [3, 0, 0, 0, 3.5, 0]],
+    ]
+
+    rows = market_data._merge_ohlcv_rows(pages)
+
+    assert rows[:, 0].tolist() == [1, 2, 3, 4]
+    assert rows[2, 4] == 3.5  # Se conserva la última versión recibida de la vela
+    assert market_data._merge_ohlcv_rows([]).shape == (0, 6)
+
+def test_aget_ohlcv_candles_paging(monkeypatch):
+    """Test para verificar la paginación de la versión asíncrona"""
+    exchange = AsyncStubExchange(max_limit=300)
+    client = stub_client("kraken", exchange)
+    monkeypatch.setattr(MarketDataClient, "_get_async_client", lambda self: exchange)
+
+    candles = asyncio.run(client.aget_ohlcv_candles("BTC/USDT", "1h", 1000))
+
+    assert candles.timestamp_ms().tolist() == exchange.times[-1000:]
+
+def test_async_client_per_event_loop(monkeypatch):
+    """Test para verificar que el cliente compartido funciona desde event loops sucesivos"""
+    import ccxt.async_support as ccxt_async
+    monkeypatch.setattr(ccxt_async, "kraken", LoopBoundExchange)
+    LoopBoundExchange.created.clear()
+    client = MarketDataClient("kraken")
+
+    async def fetch():
+        first = client._get_async_client()
+        assert client._get_async_client() is first  # Mismo loop: mismo cliente
+        return await client.aget_ohlcv_candles("BTC/USDT", "1h", 10)
+
+    first = asyncio.run(fetch())
+    market_data._OHLCV_CACHE.clear()
+    second = asyncio.run(fetch())
+
+    exchange = LoopBoundExchange.created[-1]
+    assert len(LoopBoundExchange.created) == 2
+    assert first.timestamp_ms().tolist() == LoopBoundExchange.created[0].times[-10:]
+    assert second.timestamp_ms().tolist() == exchange.times[-10:]
+    # El cliente del loop anterior, ya cerrado, se ha descartado
+    assert list(client._async_clients.values()) == [exchange]
+
+    async def close():
+        client._get_async_client()
+        await market_data.aclose_all()
+
+    asyncio.run(close())
+    assert LoopBoundExchange.created[-1].closed
+    assert client not in market_data._ASYNC_CLIENTS
+
+def test_get_ohlcv_many_cache_hits_not_throttled(monkeypatch):
+    """Test para verificar que get_ohlcv_many devuelve sin esperas los símbolos ya cacheados"""
+    exchange = AsyncStubExchange(max_limit=300, history=10)
+    client = stub_client("kraken", exchange)
+    monkeypatch.setattr(MarketDataClient, "_get_async_client", lambda self: exchange)
+    symbols = [f"SYM{i}/USDT" for i in range(10)]
+
+    first = asyncio.run(client.get_ohlcv_many(symbols, "1h", 10))
+    exchange.calls.clear()
+    start = time.monotonic()
+    second = asyncio.run(client.get_ohlcv_many(symbols, "1h", 10))
+
+    assert list(second) == symbols
+    assert all(second[symbol] is first[symbol] for symbol in symbols)
+    assert exchange.calls == []
+    assert time.monotonic() - start < 0.5
+
+def test_async_client_rate_limited():
+    """Test para verificar que las descargas asíncronas las espacia el rate limiter de CCXT"""
+    client = MarketDataClient("kraken")
+
+    async def check():
+        try:
+            assert client._get_async_client().enableRateLimit
+        finally:
+            await client.aclose()
+
+    asyncio.run(check())
+
+def test_incremental_cache_fetches_only_new_candles():
+    """Test para verificar que la caché incremental solo descarga las velas posteriores a las guardadas"""
+    exchange = StubExchange(max_limit=300)
+    client = stub_client("kraken", exchange)
+
+    rows = client._fetch_ohlcv_incremental("BTC/USDT", "1h", 200)
+    assert_latest(rows, exchange, 200)
+    path = market_data._OHLCV_DISK_DIR / "kraken" / "BTC_USDT_1h.npy"
+    assert path.exists()
+
+    exchange.calls.clear()
+    rows = client._fetch_ohlcv_incremental("BTC/USDT", "1h", 200)
+
+    assert_latest(rows, exchange, 200)
+    assert exchange.calls == [(exchange.times[-1], 500)]
+
+def test_incremental_cache_stale_refreshes():
+    """Test para verificar que una caché atrasada no devuelve velas antiguas aunque la página sea corta"""
+    exchange = StubExchange(max_limit=300)
+    client = stub_client("kraken", exchange)
+    # Caché guardada hace 1000 velas: el exchange devuelve solo 300 (menos que las 500 supuestas)
+    stale = np.array([[t, 1.0, 2.0, 0.5, 1.5, 10.0] for t in exchange.times[-1500:-1000]])
+    path = market_data._OHLCV_DISK_DIR / "kraken" / "BTC_USDT_1h.npy"
+    path.parent.mkdir(parents=True)
+    np.save(path, stale)
+
+    rows = client._fetch_ohlcv_incremental("BTC/USDT", "1h", 200)
+
+    assert_latest(rows, exchange, 200)
+    assert np.load(path)[-1, 0] == exchange.times[-1]
+
+def test_incremental_cache_skips_unknown_timeframe():
+    """Test para verificar que un timeframe desconocido se descarga sin pasar por la caché en disco"""
+    exchange = StubExchange(max_limit=300)
+    client = stub_client("kraken", exchange)
+
+    candles = client.get_ohlcv_candles("BTC/USDT", "1s", 200)
+
+    assert candles.timestamp_ms().tolist() == exchange.times[-200:]
+    assert exchange.calls
+    assert not market_data._OHLCV_DISK_DIR.exists()
+
+def test_disk_cache_disabled(monkeypatch):
+    """Test para verificar que con la caché en disco desactivada no se escribe nada"""
+    monkeypatch.setattr(market_data, "_OHLCV_DISK_CACHE", False)
+    exchange = StubExchange(max_limit=300)
+    client = stub_client("kraken", exchange)
+
+    latest = client.get_ohlcv_candles("BTC/USDT", "1h", 200)
+    history = client.get_ohlcv_candles("BTC/USDT", "1h", 100, exchange.times[1000])
+
+    assert latest.timestamp_ms().tolist() == exchange.times[-200:]
+    assert history.timestamp_ms().tolist() == exchange.times[1000:1100]
+    assert not market_data._OHLCV_DISK_DIR.exists()
+
+def history_files():
+    return sorted(p.name for p in (market_data._OHLCV_DISK_DIR / "history").glob("*.npy"))
+
+def test_history_cache_closed_window():
+    """Test para verificar que una ventana histórica cerrada se sirve desde disco"""
+    exchange = StubExchange(max_limit=1000)
+    client = stub_client("binance", exchange)
+    since = exchange.times[1000]
+
+    rows = client._fetch_ohlcv_history("BTC/USDT", "1h", 100, since)
+    exchange.calls.clear()
+    cached = client._fetch_ohlcv_history("BTC/USDT", "1h", 100, since)
+
+    assert exchange.calls == []
+    assert np.array_equal(cached, rows)
+    assert len(history_files()) == 1
+
+def test_history_cache_open_window_expires():
+    """Test para verificar que una ventana que llega a la vela en formación caduca por mtime"""
+    exchange = StubExchange(max_limit=1000)
+    client = stub_client("binance", exchange)
+    since = exchange.times[-10]
+
+    client._fetch_ohlcv_history("BTC/USDT", "1h", 100, since)
+    exchange.calls.clear()
+    client._fetch_ohlcv_history("BTC/USDT", "1h", 100, since)
+    assert exchange.calls == []
+
+    # Archivo guardado hace más del TTL: se descarga de nuevo
+    path = market_data._OHLCV_DISK_DIR / "history" / history_files()[0]
+    old = time.time() - market_data._OHLCV_HISTORY_TTL - 1
+    os.utime(path, (old, old))
+    client._fetch_ohlcv_history("BTC/USDT", "1h", 100, since)
+    assert exchange.calls
+
+def test_history_cache_evicts_oldest(monkeypatch):
+    """Test para verificar que la caché histórica no supera el número máximo de archivos"""
+    monkeypatch.setattr(market_data, "_OHLCV_HISTORY_MAX_FILES", 3)
+    exchange = StubExchange(max_limit=1000)
+    client = stub_client("binance", exchange)
+    directory = market_data._OHLCV_DISK_DIR / "history"
+
+    paths = []
+    for i in range(5):
+        client._fetch_ohlcv_history("BTC/USDT", "1h", 10, exchange.times[i * 100])
+        path = max(directory.glob("*.npy"), key=lambda p: p.stat().st_mtime_ns)
+        # mtimes crecientes aunque la resolución del sistema de archivos sea gruesa
+        os.utime(path, (1_000_000 + i, 1_000_000 + i))
+        paths.append(path.name)
+
+    assert history_files() == sorted(paths[-3:])
+
+def test_cached_candles_dataframe_is_writable():
+    """Test para verificar que el DataFrame de unas velas cacheadas se puede modificar sin tocar la caché"""
+    exchange = StubExchange(max_limit=300)
+    client = stub_client("kraken", exchange)
+    candles = client.get_ohlcv_candles("BTC/USDT", "1h", 50)
+    assert not candles.close.flags.writeable
+
+    df = client.get_ohlcv_data("BTC/USDT", "1h", 50)
+    df.loc[0, "close"] = 123.0
+    df["sma"] = df["close"].rolling(3).mean()
+
+    assert list(df.columns) == ["timestamp", "open", "high", "low", "close", "volume", "sma"]
+    assert candles.close[0] == 1.5
+    assert client.get_ohlcv_candles("BTC/USDT", "1h", 50) is candles
+
+def test_session_leaves_error_statuses_to_ccxt():
+    """Test para verificar que la sesión HTTP compartida no reintenta respuestas de error"""
+    retry = market_data._SESSION.get_adapter("https://api.binance.com").max_retries
+
+    assert retry.connect == 3
+    assert retry.status == 0
+    assert not retry.status_forcelist
+    assert not retry.raise_on_status
+    assert not retry.is_retry("GET", 429)
+    assert not retry.is_retry("GET", 429, has_retry_after=True)
+
+class StubMarketsClient:
+    """Cliente CCXT simulado para la caché de mercados"""
+    def __init__(self):
+        self.markets = None
+        self.loads = 0
+
+    def load_markets(self):
+        self.loads += 1
+        self.markets = {"BTC/USDT": {"symbol": "BTC/USDT", "active": True, "quote": "USDT"}}
+        return self.markets
+
+    def set_markets(self, markets):
+        self.markets = markets
+
+def test_markets_cache_round_trip():
+    """Test para verificar que los mercados guardados en disco se reutilizan sin load_markets"""
+    first = StubMarketsClient()
+    market_data._load_markets_cached(first, "kraken")
+    second = StubMarketsClient()
+    market_data._load_markets_cached(second, "kraken")
+
+    assert first.loads == 1
+    assert second.loads == 0
+    assert second.markets == first.markets
+
+def test_markets_cache_invalidated_by_ccxt_version(monkeypatch):
+    """Test para verificar que otra versión de CCXT no reutiliza los mercados guardados"""
+    import ccxt
+    market_data._load_markets_cached(StubMarketsClient(), "kraken")
+    monkeypatch.setattr(ccxt, "__version__", "0.0.0-otra")
+
+    client = StubMarketsClient()
+    market_data._load_markets_cached(client, "kraken")
+
+    assert client.loads == 1
+    assert len(list(market_data._MARKETS_CACHE_DIR.glob("kraken-*.json"))) == 2
+
+def test_markets_cache_corrupt_or_expired_file():
+    """Test para verificar que un archivo corrupto o caducado se descarga y se reescribe"""
+    import ccxt
+    path = market_data._MARKETS_CACHE_DIR / f"kraken-{ccxt.__version__}.json"
+    path.parent.mkdir(parents=True)
+    path.write_text("{no json")
+
+    client = StubMarketsClient()
+    market_data._load_markets_cached(client, "kraken")
+    assert client.loads == 1
+    assert "BTC/USDT" in path.read_text()
+
+    old = time.time() - market_data._MARKETS_CACHE_TTL - 1
+    os.utime(path, (old, old))
+    client = StubMarketsClient()
+    market_data._load_markets_cached(client, "kraken")
+    assert client.loads == 1
+
+def test_public_ccxt_client_pool(monkeypatch):
+    """Test para verificar que el pool de clientes públicos reutiliza una instancia por exchange"""
+    monkeypatch.setattr(market_data, "_PUBLIC_CLIENTS", {})
+
+    kraken = market_data._public_ccxt_client("kraken")
+
+    assert market_data._public_ccxt_client("kraken") is kraken
+    assert market_data._public_ccxt_client("okx") is not kraken
+    assert market_data._public_ccxt_client("no-existe") is None
+    assert set(market_data._PUBLIC_CLIENTS) == {"kraken", "okx"}
+    assert not kraken.apiKey
+
+def test_available_pairs_other_exchange_uses_pool(monkeypatch):
+    """Test para verificar que los pares de otro exchange salen del cliente público compartido"""
+    monkeypatch.setattr(market_data, "_PUBLIC_CLIENTS", {})
+    monkeypatch.setattr(market_data, "_PAIRS_CACHE", {})
+    loaded = []
+
+    def fake_load_markets(client, exchange_id):
+        loaded.append((client, exchange_id))
+        client.markets = {
+            "ETH/USDT": {"active": True, "quote": "USDT"},
+            "BTC/USDT": {"active": True, "quote": "USDT"},
+            "BTC/EUR": {"active": True, "quote": "EUR"},
+            "OLD/USDT": {"active": False, "quote": "USDT"},
+        }
+
+    monkeypatch.setattr(market_data, "_load_markets_cached", fake_load_markets)
+    client = MarketDataClient("binance")
+
+    assert client.get_available_pairs("KRAKEN") == ["BTC/USDT", "ETH/USDT"]
+    assert client.get_available_pairs("kraken") == ["BTC/USDT", "ETH/USDT"]
+    assert loaded == [(market_data._PUBLIC_CLIENTS["kraken"], "kraken")]
+
+def test_shared_market_data_client_reuse():
+    """Test para verificar que get_market_data_client devuelve la misma instancia en cada llamada"""
+    kraken = get_market_data_client("kraken")
+
+    assert get_market_data_client("kraken") is kraken
+    assert get_market_data_client("Kraken") is kraken
+    assert get_market_data_client("okx") is not kraken
+    assert market_data._shared_market_data_client.cache_info().maxsize == 32
+
+def test_float32_candles_round_trip(monkeypatch):
+    """Test para verificar que con float32 el tipo se conserva en Candles, la caché y to_df"""
+    monkeypatch.setattr(market_data, "_OHLCV_DTYPE", np.float32)
+    exchange = StubExchange(max_limit=300)
+    client = stub_client("kraken", exchange)
+
+    candles = client.get_ohlcv_candles("BTC/USDT", "1h", 50)
+    cached = client.get_ohlcv_candles("BTC/USDT", "1h", 50)
+    df = client.get_ohlcv_data("BTC/USDT", "1h", 50)
+
+    assert cached is candles
+    for column in ("open", "high", "low", "close", "volume"):
+        assert getattr(candles, column).dtype == np.float32
+        assert df[column].dtype == np.float32
+    # Los timestamps siguen en datetime64: float32 no representa milisegundos actuales
+    assert df["timestamp"].dtype == "datetime64[ns]"
+    assert candles.timestamp_ms().tolist() == exchange.times[-50:]
+    assert df["close"].tolist() == [1.5] * 50
+
+def test_mock_candles_calendar_alignment():
+    """Test para verificar que las velas simuladas se alinean como las del exchange"""
+    client = MarketDataClient("binance")
+
+    hourly = client.generate_mock_candles("BTC/USDT", "1h", 5).to_df()["timestamp"]
+    assert (hourly.dt.minute == 0).all()
+    assert (hourly.diff().dropna() == np.timedelta64(1, "h")).all()
+
+    weekly = client.generate_mock_candles("BTC/USDT", "1w", 5).to_df()["timestamp"]
+    assert (weekly.dt.dayofweek == 0).all()  # Lunes
+    assert (weekly.dt.hour == 0).all()
+
+    monthly = client.generate_mock_candles("BTC/USDT", "1M", 14).to_df()["timestamp"]
+    assert (monthly.dt.day == 1).all()
+    assert (monthly.dt.hour == 0).all()
+    months = monthly.dt.year * 12 + monthly.dt.month
+    assert (months.diff().dropna() == 1).all()
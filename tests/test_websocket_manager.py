@@ -0,0 +1,60 @@
+import asyncio
+import importlib.util
+import logging
+from pathlib import Path
+
+from app.utils import market_data
+
+# Igual que el router de klines, el módulo vive en api/app y se carga desde su ruta
+MODULE_PATH = Path(__file__).resolve().parents[1] / "api" / "app" / "utils" / "websocket_manager.py"
+spec = importlib.util.spec_from_file_location("api_websocket_manager", MODULE_PATH)
+websocket_manager = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(websocket_manager)
+
+class FakeWebSocket:
+    """WebSocket simulado que guarda los mensajes enviados"""
+    def __init__(self, on_send):
+        self.messages = []
+        self.on_send = on_send
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, message):
+        self.messages.append(message)
+        self.on_send()
+
+class StubMarketClient:
+    """Cliente de mercado que devuelve una vela para BTC y se cancela para ETH"""
+    async def aget_market_data(self, exchange, symbol, timeframe="1h", limit=100):
+        if symbol == "ETH/USDT":
+            raise asyncio.CancelledError()
+        candles = market_data.MarketDataClient("binance").generate_mock_candles(symbol, timeframe, limit)
+        return candles.to_df()
+
+def test_broadcast_loop_handles_cancelled_fetch(monkeypatch, caplog):
+    """Test para verificar que una petición cancelada no rompe el broadcast del resto de símbolos"""
+    monkeypatch.setattr(market_data, "get_market_data_client", lambda exchange_id="binance": StubMarketClient())
+    manager = websocket_manager.ConnectionManager()
+    broadcaster = websocket_manager.DataBroadcaster(manager)
+
+    def stop():
+        broadcaster.should_stop = True
+
+    btc = FakeWebSocket(stop)
+    eth = FakeWebSocket(stop)
+
+    async def run():
+        await manager.connect(eth, "ETH/USDT")
+        await manager.connect(btc, "BTC/USDT")
+        await broadcaster.start(interval_seconds=0.01)
+        await asyncio.wait_for(broadcaster.task, timeout=5)
+
+    with caplog.at_level(logging.ERROR):
+        asyncio.run(run())
+
+    assert len(btc.messages) == 1
+    assert '"kline_update"' in btc.messages[0]
+    assert eth.messages == []
+    assert "CancelledError" in caplog.text
+    assert "has no attribute" not in caplog.text